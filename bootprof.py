@@ -0,0 +1,34 @@
+import time
+
+# Boot profile: milliseconds spent per boot phase, counted from reset
+# (ticks_ms starts at 0 on reset). boot.py imports this module first.
+_last = 0
+phases = []
+# Drivers and modules initialized on first use (see lazy.py)
+first_use = []
+
+
+def mark(name):
+    """! @brief End of boot phase `name`, timed from the end of the previous one."""
+    global _last
+    now = time.ticks_ms()
+    phases.append((name, time.ticks_diff(now, _last)))
+    _last = now
+
+
+def report():
+    print("Boot profile (ms):")
+    for name, ms in phases:
+        print("  %-12s %6d" % (name, ms))
+    print("  %-12s %6d" % ("total", _last))
+
+
+def stats():
+    return {
+        "phases_ms": dict(phases),
+        "total_ms": _last,
+        "first_use_ms": dict(first_use),
+    }
+
+
+mark("reset")
@@ -1,99 +1,113 @@
 import time
 import machine
+from micropython import const
 
-# These are the notes with equivalent frequency
+import uasyncio as asyncio
+
+import lazy
+
+# These are the notes with equivalent frequency. They are compile-time
+# constants, so the table takes no RAM.
 # https://www.blackghostaudio.com/blog/basic-music-theory-for-beginners
-B0  = 31
-C1  = 33
-CS1 = 35
-D1  = 37
-DS1 = 39
-E1  = 41
-F1  = 44
-FS1 = 46
-G1  = 49
-GS1 = 52
-A1  = 55
-AS1 = 58
-B1  = 62
-C2  = 65
-CS2 = 69
-D2  = 73
-DS2 = 78
-E2  = 82
-F2  = 87
-FS2 = 93
-G2  = 98
-GS2 = 104
-A2  = 110
-AS2 = 117
-B2  = 123
-C3  = 131
-CS3 = 139
-D3  = 147
-DS3 = 156
-E3  = 165
-F3  = 175
-FS3 = 185
-G3  = 196
-GS3 = 208
-A3  = 220
-AS3 = 233
-B3  = 247
-C4  = 262
-CS4 = 277
-D4  = 294
-DS4 = 311
-E4  = 330
-F4  = 349
-FS4 = 370
-G4  = 392
-GS4 = 415
-A4  = 440
-AS4 = 466
-B4  = 494
-C5  = 523
-CS5 = 554
-D5  = 587
-DS5 = 622
-E5  = 659
-F5  = 698
-FS5 = 740
-G5  = 784
-GS5 = 831
-A5  = 880
-AS5 = 932
-B5  = 988
-C6  = 1047
-CS6 = 1109
-D6  = 1175
-DS6 = 1245
-E6  = 1319
-F6  = 1397
-FS6 = 1480
-G6  = 1568
-GS6 = 1661
-A6  = 1760
-AS6 = 1865
-B6  = 1976
-C7  = 2093
-CS7 = 2217
-D7  = 2349
-DS7 = 2489
-E7  = 2637
-F7  = 2794
-FS7 = 2960
-G7  = 3136
-GS7 = 3322
-A7  = 3520
-AS7 = 3729
-B7  = 3951
-C8  = 4186
-CS8 = 4435
-D8  = 4699
-DS8 = 4978
+_B0 = const(31)
+_C1 = const(33)
+_CS1 = const(35)
+_D1 = const(37)
+_DS1 = const(39)
+_E1 = const(41)
+_F1 = const(44)
+_FS1 = const(46)
+_G1 = const(49)
+_GS1 = const(52)
+_A1 = const(55)
+_AS1 = const(58)
+_B1 = const(62)
+_C2 = const(65)
+_CS2 = const(69)
+_D2 = const(73)
+_DS2 = const(78)
+_E2 = const(82)
+_F2 = const(87)
+_FS2 = const(93)
+_G2 = const(98)
+_GS2 = const(104)
+_A2 = const(110)
+_AS2 = const(117)
+_B2 = const(123)
+_C3 = const(131)
+_CS3 = const(139)
+_D3 = const(147)
+_DS3 = const(156)
+_E3 = const(165)
+_F3 = const(175)
+_FS3 = const(185)
+_G3 = const(196)
+_GS3 = const(208)
+_A3 = const(220)
+_AS3 = const(233)
+_B3 = const(247)
+_C4 = const(262)
+_CS4 = const(277)
+_D4 = const(294)
+_DS4 = const(311)
+_E4 = const(330)
+_F4 = const(349)
+_FS4 = const(370)
+_G4 = const(392)
+_GS4 = const(415)
+_A4 = const(440)
+_AS4 = const(466)
+_B4 = const(494)
+_C5 = const(523)
+_CS5 = const(554)
+_D5 = const(587)
+_DS5 = const(622)
+_E5 = const(659)
+_F5 = const(698)
+_FS5 = const(740)
+_G5 = const(784)
+_GS5 = const(831)
+_A5 = const(880)
+_AS5 = const(932)
+_B5 = const(988)
+_C6 = const(1047)
+_CS6 = const(1109)
+_D6 = const(1175)
+_DS6 = const(1245)
+_E6 = const(1319)
+_F6 = const(1397)
+_FS6 = const(1480)
+_G6 = const(1568)
+_GS6 = const(1661)
+_A6 = const(1760)
+_AS6 = const(1865)
+_B6 = const(1976)
+_C7 = const(2093)
+_CS7 = const(2217)
+_D7 = const(2349)
+_DS7 = const(2489)
+_E7 = const(2637)
+_F7 = const(2794)
+_FS7 = const(2960)
+_G7 = const(3136)
+_GS7 = const(3322)
+_A7 = const(3520)
+_AS7 = const(3729)
+_B7 = const(3951)
+_C8 = const(4186)
+_CS8 = const(4435)
+_D8 = const(4699)
+_DS8 = const(4978)
 
-p14 = machine.Pin(14,machine.Pin.OUT)
+BUZZER_PIN = 14
+# The pin is set up when the first melody plays
+pin = lazy.Lazy("buzzer", lambda: machine.Pin(BUZZER_PIN, machine.Pin.OUT))
+
+# Melodies of the notifications: (notes, milliseconds per note, duty)
+NOTIFY = ((_A4, _A4, _A4), 100, 150)
+NOTIFY1 = NOTIFY
+NOTIFY2 = ((_A4, _A4, _A4), 100, 100)
+NOTIFY3 = ((_A4, _G7), 100, 200)
 
 # Function play is use to play sound from a list of notes
 def play(pin, melodies, delays, duty):
@@ -109,20 +123,35 @@ def play(pin, melodies, delays, duty):
     pwm.deinit()
 
 
+# Same as play, as a coroutine sleeping on the event loop between the notes
+def aplay(pin, melodies, delay_ms, duty):
+    pwm = machine.PWM(pin)
+    try:
+        for note in melodies:
+            pwm.freq(note)
+            pwm.duty(duty)
+            yield from asyncio.sleep_ms(delay_ms)
+    finally:
+        pwm.duty(0)
+        pwm.deinit()
+
+
+# Blocking versions, for use before the event loop runs
+
 def notify():
-    buzz = [A4,A4,A4]
-    play(p14,buzz,0.1,150)
+    notes, delay_ms, duty = NOTIFY
+    play(pin.get(), notes, delay_ms / 1000, duty)
 
 def notify1():
-    buzz = [A4,A4,A4]
-    play(p14,buzz,0.1,150)
+    notes, delay_ms, duty = NOTIFY1
+    play(pin.get(), notes, delay_ms / 1000, duty)
 
 def notify2():
-    buzz = [A4,A4,A4]
-    play(p14,buzz,0.1,100)
+    notes, delay_ms, duty = NOTIFY2
+    play(pin.get(), notes, delay_ms / 1000, duty)
 
 def notify3():
-    buzz = [A4,G7]
-    play(p14,buzz,0.1,200)
+    notes, delay_ms, duty = NOTIFY3
+    play(pin.get(), notes, delay_ms / 1000, duty)
 
 #notify3()
\ No newline at end of file
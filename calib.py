@@ -0,0 +1,120 @@
+# Calibration profile of the solar and battery voltage dividers. A profile
+# stored on flash (CALIB_FILE, JSON) overrides any of these values.
+#
+# @attention There is an addition of 0.13V (163 analog value) to the voltage that is read.
+# This is due to the inaccuracy in the measurements and to calibrate the reading.
+# The value is declared after measureing different value and comapring with real value.
+# It might vary depending on your ESP32 module or device.
+DEFAULT_PROFILE = {
+    "adc_ref_mv": 3300,         # ADC full scale with 11 dB attenuation
+    "adc_max": 4095,            # 12 bit
+    "offset_mv": 130,           # added to readings above offset_threshold
+    "offset_threshold": 12,     # ADC counts
+    "solar_r1": 21600,          # solar divider, ohm
+    "solar_r2": 8170,
+    "solar_load": 21600 + 8100, # resistance the solar current is computed for, ohm
+    "batt_divider": 2,          # battery voltage / ADC pin voltage
+    "batt_empty_mv": 2700,
+    "batt_full_mv": 4700,
+}
+CALIB_FILE = "calib.json"
+
+# Fractional bits of the fixed-point coefficients. Keeps raw * coefficient
+# of all channels within MicroPython's small int range.
+SHIFT = 14
+
+
+def load_profile(fname=CALIB_FILE):
+    """! @brief Default profile updated with the one stored in `fname`, if any."""
+    import json
+    profile = dict(DEFAULT_PROFILE)
+    try:
+        with open(fname) as f:
+            profile.update(json.load(f))
+    except (OSError, ValueError):
+        pass
+    return profile
+
+
+class Calibration:
+    """! @brief Converts raw ADC counts to integer engineering units.
+    Every output is a linear function of the ADC counts, whose coefficients
+    are precomputed in fixed point when the profile is loaded:
+        y = ((raw * k + (offset if raw > threshold else 0)) >> SHIFT) + c
+    so conversion uses small int arithmetic only and allocates nothing.
+    """
+
+    def __init__(self, profile=None):
+        if profile is None:
+            profile = load_profile()
+        self.profile = profile
+        one = 1 << SHIFT
+        mv_per_count = profile["adc_ref_mv"] / profile["adc_max"]
+        offset = profile["offset_mv"]
+        self.threshold = profile["offset_threshold"]
+
+        # Solar divider output (pin) voltage in mV
+        self.vout_k = round(mv_per_count * one)
+        self.vout_o = round(offset * one)
+        # Solar panel voltage in mV
+        div = (profile["solar_r1"] + profile["solar_r2"]) / profile["solar_r2"]
+        self.mv_k = round(mv_per_count * div * one)
+        self.mv_o = round(offset * div * one)
+        # Solar current through the load in uA: mV * 1000 / ohm
+        cur = div * 1000 / profile["solar_load"]
+        self.ua_k = round(mv_per_count * cur * one)
+        self.ua_o = round(offset * cur * one)
+        # Battery charge in 0.1 %
+        span = profile["batt_full_mv"] - profile["batt_empty_mv"]
+        pct = profile["batt_divider"] * 1000 / span
+        self.pct_k = round(mv_per_count * pct * one)
+        self.pct_o = round(offset * pct * one)
+        self.pct_c = -round(profile["batt_empty_mv"] * 1000 / span)
+
+    def convert(self, ring, first, last):
+        """! @brief Fill the scaled columns of samples `first`..`last` of a SampleRing
+        from their ADC counts, in one pass.
+        """
+        thr = self.threshold
+        vout_k = self.vout_k
+        vout_o = self.vout_o
+        mv_k = self.mv_k
+        mv_o = self.mv_o
+        ua_k = self.ua_k
+        ua_o = self.ua_o
+        pct_k = self.pct_k
+        pct_o = self.pct_o
+        pct_c = self.pct_c
+        solar = ring.solar
+        batt = ring.batt
+        i = ring.index(first)
+        size = ring.size
+        for n in range(last - first + 1):
+            raw = solar[i]
+            if raw > thr:
+                vout = (raw * vout_k + vout_o) >> SHIFT
+                mv = (raw * mv_k + mv_o) >> SHIFT
+                ua = (raw * ua_k + ua_o) >> SHIFT
+            else:
+                vout = (raw * vout_k) >> SHIFT
+                mv = (raw * mv_k) >> SHIFT
+                ua = (raw * ua_k) >> SHIFT
+            ring.vout_mv[i] = vout
+            ring.solar_mv[i] = mv
+            ring.solar_ua[i] = ua
+            ring.solar_uw[i] = mv * ua // 1000
+
+            raw = batt[i]
+            if raw > thr:
+                pct = ((raw * pct_k + pct_o) >> SHIFT) + pct_c
+            else:
+                pct = ((raw * pct_k) >> SHIFT) + pct_c
+            if pct < 0:
+                pct = 0
+            elif pct > 1000:
+                pct = 1000
+            ring.batt_pct[i] = pct
+
+            i += 1
+            if i == size:
+                i = 0
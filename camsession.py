@@ -0,0 +1,140 @@
+import machine
+import time
+
+import uasyncio as asyncio
+
+import lazy
+
+
+def _camera():
+    import camera
+    return camera
+
+
+# The camera driver is imported with the first capture
+camera_mod = lazy.Lazy("camera", _camera)
+
+# Frames younger than this are served again instead of taking a new photo
+FRAME_MAX_AGE_MS = 1000
+# The camera is switched off after this long without a capture
+IDLE_DEINIT_MS = 30000
+# Consecutive failed captures after which the node is reset
+MAX_CAPTURE_FAILURES = 5
+
+
+class CameraSession:
+    """! @brief Keeps the camera initialized between captures and caches the last frame.
+    The camera is initialized on the first capture and switched off again by
+    idle_watch() once nobody asked for a photo for `idle_ms`. Requests within
+    `max_age_ms` of the last capture get the cached JPEG buffer.
+    """
+
+    def __init__(self, max_age_ms=FRAME_MAX_AGE_MS, idle_ms=IDLE_DEINIT_MS, quality=12):
+        self.max_age_ms = max_age_ms
+        self.idle_ms = idle_ms
+        self.quality = quality
+        self.inited = False
+        self.frame = None
+        self.frame_time = 0
+        self.last_used = time.ticks_ms()
+        self.false_count = 0
+        # Counters
+        self.hits = 0
+        self.captures = 0
+        self.failures = 0
+        self.inits = 0
+
+    def init(self):
+        """! @brief Configure Camera Pins and Initiate Camera.
+            Set Quality of Camera to `quality` (1-60).
+        """
+        camera = camera_mod.get()
+        try:
+            camera.init(0, d0=4, d1=5, d2=18, d3=19, d4=36, d5=39, d6=34, d7=35, format=camera.JPEG,
+                        framesize=camera.FRAME_VGA, xclk=21, pclk=22, vsync=25, href=23, siod=26, sioc=27, pwdn=-1, reset=-1)
+        except:
+            camera.deinit()
+            camera.init(0, d0=4, d1=5, d2=18, d3=19, d4=36, d5=39, d6=34, d7=35, format=camera.JPEG,
+                        framesize=camera.FRAME_VGA, xclk=21, pclk=22, vsync=25, href=23, siod=26, sioc=27, pwdn=-1, reset=-1)
+        camera.quality(self.quality)
+        self.inited = True
+        self.inits += 1
+
+    def set_quality(self, quality):
+        """! @brief Change the JPEG quality (1-60, lower is better), also of a running camera."""
+        self.quality = quality
+        if self.inited:
+            camera_mod.get().quality(quality)
+        # The cached frame has the old quality
+        self.frame = None
+
+    def deinit(self):
+        if self.inited:
+            camera_mod.get().deinit()
+            self.inited = False
+
+    def capture(self):
+        """ @brief Captures an image, initializing the camera if needed.
+        Prints the Time taken for capture.
+        @exception The Pin configures for camera might be used for other values and not assigned back to Camera
+
+        @return buffer object that has the image, None if the capture failed.
+        """
+        if not self.inited:
+            self.init()
+        cam_start_time = time.ticks_ms()
+        print("Taking a photo...")
+        buf = camera_mod.get().capture()
+        if not buf:
+            print("Camera Capture failed")
+            self.failures += 1
+            self.false_count += 1
+            if self.false_count > MAX_CAPTURE_FAILURES:
+                machine.reset()
+            # Try a fresh init on the next capture
+            self.deinit()
+            return None
+        cam_end_time = time.ticks_ms()
+        print("Time to capture photo:" + str(time.ticks_diff(cam_end_time, cam_start_time)))
+        self.false_count = 0
+        self.captures += 1
+        self.frame = buf
+        self.frame_time = cam_end_time
+        return buf
+
+    def get_frame(self, max_age_ms=None):
+        """! @brief Latest frame, captured anew only if the cached one is too old.
+        @return JPEG buffer, None if the capture failed.
+        """
+        if max_age_ms is None:
+            max_age_ms = self.max_age_ms
+        now = time.ticks_ms()
+        self.last_used = now
+        if self.frame is not None and time.ticks_diff(now, self.frame_time) <= max_age_ms:
+            self.hits += 1
+            return self.frame
+        return self.capture()
+
+    def idle_watch(self):
+        """! @brief Coroutine switching the camera off once it was idle for `idle_ms`."""
+        while True:
+            yield from asyncio.sleep_ms(self.idle_ms // 2)
+            if self.inited and time.ticks_diff(time.ticks_ms(), self.last_used) >= self.idle_ms:
+                print("Camera idle, deinit")
+                self.deinit()
+                # The cached frame is stale by now, let it be collected
+                self.frame = None
+
+    def stats(self):
+        age = -1
+        if self.frame is not None:
+            age = time.ticks_diff(time.ticks_ms(), self.frame_time)
+        return {
+            "inited": self.inited,
+            "captures": self.captures,
+            "cache_hits": self.hits,
+            "failures": self.failures,
+            "inits": self.inits,
+            "frame_age_ms": age,
+            "max_age_ms": self.max_age_ms,
+        }
@@ -0,0 +1,10 @@
+# Node settings shared by boot.py and main.py
+
+# Known Wi-Fi networks, SSID -> password. The supervisor in wifi.py tries
+# the ones in range, strongest signal first.
+NETWORKS = {
+    'Kocin': 'kocin555',
+    'ASUS-sbak': 'Gurubhavan1$',
+    'Stockholms_stadsbibliotek': 'stockholm',
+}
+HOST_NAME = 'minimist-thesis'
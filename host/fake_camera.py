@@ -0,0 +1,43 @@
+# Host stand-in for the ESP32 `camera` module, used by host/run.py.
+# capture() blocks for about as long as the OV2640 does, so the effect of a
+# slow capture on the other clients can be observed.
+import time
+
+JPEG = 3
+FRAME_VGA = 8
+
+# Emulated capture time in milliseconds and size of the returned frame.
+CAPTURE_MS = 150
+FRAME_SIZE = 24 * 1024
+
+_inited = False
+_quality = 12
+_frame = None
+
+
+def init(id, **kwargs):
+    global _inited
+    if _inited:
+        raise OSError("Camera already initialized")
+    _inited = True
+
+
+def deinit():
+    global _inited
+    _inited = False
+
+
+def quality(val):
+    global _quality
+    _quality = val
+
+
+def capture():
+    global _frame
+    if not _inited:
+        return False
+    time.sleep_ms(CAPTURE_MS)
+    if _frame is None:
+        # Minimal JPEG markers around a filler payload
+        _frame = b"\xff\xd8" + bytes(FRAME_SIZE - 4) + b"\xff\xd9"
+    return _frame
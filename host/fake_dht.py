@@ -0,0 +1,26 @@
+# Host stand-in for the `dht` driver, used by host/run.py.
+import time
+import random
+
+
+class DHT11:
+
+    def __init__(self, pin):
+        self.pin = pin
+        self._t = 21
+        self._h = 45
+
+    def measure(self):
+        # The real sensor needs ~20 ms of bit-banging per measurement
+        time.sleep_ms(20)
+        self._t = 21 + random.randint(-1, 1)
+        self._h = 45 + random.randint(-2, 2)
+
+    def temperature(self):
+        return self._t
+
+    def humidity(self):
+        return self._h
+
+
+DHT22 = DHT11
@@ -0,0 +1,5 @@
+# Host stand-in for the `esp` module, used by host/run.py.
+
+
+def osdebug(level):
+    pass
@@ -0,0 +1,141 @@
+# Host stand-in for the ESP32 `machine` module, used by host/run.py.
+import os
+import time
+import random
+
+PWRON_RESET = 1
+HARD_RESET = 2
+WDT_RESET = 3
+DEEPSLEEP_RESET = 4
+SOFT_RESET = 5
+TIMER_WAKE = 4
+
+# RTC memory is kept in RTC_FILE so it survives a "deep sleep", which ends
+# the process. Starting host/run.py again is the wake up.
+RTC_FILE = "/tmp/minimist-rtc.bin"
+_SLEEP_FILE = RTC_FILE + ".sleep"
+
+try:
+    os.remove(_SLEEP_FILE)
+    _reset_cause = DEEPSLEEP_RESET
+except OSError:
+    _reset_cause = PWRON_RESET
+
+_pins = {}
+
+
+class Pin:
+    IN = 1
+    OUT = 3
+    PULL_UP = 2
+    PULL_DOWN = 1
+
+    def __init__(self, id, mode=-1, pull=-1, value=None):
+        self.id = id
+        self._value = 0 if value is None else value
+        _pins[id] = self
+
+    def value(self, val=None):
+        if val is None:
+            return self._value
+        self._value = val
+
+    def on(self):
+        self._value = 1
+
+    def off(self):
+        self._value = 0
+
+    def __repr__(self):
+        return "Pin(%d)" % self.id
+
+
+class ADC:
+    ATTN_0DB = 0
+    ATTN_2_5DB = 1
+    ATTN_6DB = 2
+    ATTN_11DB = 3
+    WIDTH_9BIT = 0
+    WIDTH_10BIT = 1
+    WIDTH_11BIT = 2
+    WIDTH_12BIT = 3
+
+    def __init__(self, pin):
+        self.pin = pin
+        # Random walk around mid-scale so the graphs have something to show
+        self._level = 2000
+
+    def atten(self, atten):
+        pass
+
+    def width(self, width):
+        pass
+
+    def read(self):
+        self._level += random.randint(-40, 40)
+        self._level = min(max(self._level, 0), 4095)
+        return self._level
+
+
+class PWM:
+
+    def __init__(self, pin, freq=0, duty=0):
+        self.pin = pin
+        self._freq = freq
+        self._duty = duty
+
+    def freq(self, val=None):
+        if val is None:
+            return self._freq
+        self._freq = val
+
+    def duty(self, val=None):
+        if val is None:
+            return self._duty
+        self._duty = val
+
+    def deinit(self):
+        pass
+
+
+class RTC:
+
+    def memory(self, data=None):
+        if data is None:
+            try:
+                with open(RTC_FILE, "rb") as f:
+                    return f.read()
+            except OSError:
+                return b""
+        with open(RTC_FILE, "wb") as f:
+            f.write(data)
+
+
+def reset_cause():
+    return _reset_cause
+
+
+def wake_reason():
+    return TIMER_WAKE if _reset_cause == DEEPSLEEP_RESET else 0
+
+
+def lightsleep(ms=None):
+    time.sleep_ms(ms)
+
+
+def deepsleep(ms=None):
+    with open(_SLEEP_FILE, "wb") as f:
+        f.write(b"%d" % (ms or 0))
+    raise SystemExit("machine.deepsleep(%s)" % ms)
+
+
+def reset():
+    raise SystemExit("machine.reset()")
+
+
+def freq(val=None):
+    return 240000000
+
+
+def unique_id():
+    return b"\x00host0"
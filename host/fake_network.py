@@ -0,0 +1,42 @@
+# Host stand-in for the `network` module, used by host/run.py.
+# The station is always connected to a single emulated access point.
+STA_IF = 0
+AP_IF = 1
+
+
+class WLAN:
+
+    def __init__(self, interface_id=STA_IF):
+        self._active = False
+        self._connected = True
+        self._config = {"dhcp_hostname": "host"}
+
+    def active(self, is_active=None):
+        if is_active is None:
+            return self._active
+        self._active = is_active
+
+    def isconnected(self):
+        return self._connected
+
+    def connect(self, ssid=None, password=None):
+        self._connected = True
+
+    def disconnect(self):
+        self._connected = False
+
+    def config(self, *args, **kwargs):
+        if args:
+            return self._config.get(args[0])
+        self._config.update(kwargs)
+
+    def status(self, param=None):
+        if param == "rssi":
+            return -50
+        return 1010
+
+    def ifconfig(self):
+        return ("127.0.0.1", "255.0.0.0", "127.0.0.1", "127.0.0.1")
+
+    def scan(self):
+        return [(b"Kocin", b"\x00\x11\x22\x33\x44\x55", 6, -50, 3, False)]
@@ -0,0 +1,72 @@
+"""Concurrent load generator for the ground-station web server (CPython).
+
+Starts N client threads which each poll the given endpoints in a loop, and
+prints per-endpoint latency and error statistics at the end. Run it against
+host/run.py or a real node:
+
+    python3 host/loadtest.py http://127.0.0.1:8080/ -c 8 -d 20
+"""
+import argparse
+import threading
+import time
+import urllib.request
+
+
+def worker(base, paths, deadline, stats, lock):
+    i = 0
+    while time.time() < deadline:
+        path = paths[i % len(paths)]
+        i += 1
+        start = time.time()
+        try:
+            with urllib.request.urlopen(base + path, timeout=10) as f:
+                f.read()
+            ok = True
+        except Exception:
+            ok = False
+        elapsed = time.time() - start
+        with lock:
+            s = stats.setdefault(path, {"n": 0, "err": 0, "lat": []})
+            s["n"] += 1
+            if ok:
+                s["lat"].append(elapsed)
+            else:
+                s["err"] += 1
+
+
+def main():
+    p = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    p.add_argument("base", help="server URL, e.g. http://127.0.0.1:8080/")
+    p.add_argument("-c", "--clients", type=int, default=8)
+    p.add_argument("-d", "--duration", type=float, default=10.0)
+    p.add_argument("-p", "--paths", default="getsensor,getsolar,getimage")
+    args = p.parse_args()
+
+    base = args.base.rstrip("/") + "/"
+    paths = args.paths.split(",")
+    deadline = time.time() + args.duration
+    stats = {}
+    lock = threading.Lock()
+    threads = []
+    for n in range(args.clients):
+        # Rotate the path order so the clients don't march in lockstep
+        order = paths[n % len(paths):] + paths[:n % len(paths)]
+        t = threading.Thread(target=worker, args=(base, order, deadline, stats, lock))
+        t.start()
+        threads.append(t)
+    for t in threads:
+        t.join()
+
+    for path, s in sorted(stats.items()):
+        lat = sorted(s["lat"])
+        if lat:
+            p50 = lat[len(lat) // 2] * 1000
+            p95 = lat[int(len(lat) * 0.95)] * 1000
+            print("%-12s n=%-5d err=%-4d p50=%7.1fms p95=%7.1fms max=%7.1fms"
+                  % (path, s["n"], s["err"], p50, p95, lat[-1] * 1000))
+        else:
+            print("%-12s n=%-5d err=%-4d" % (path, s["n"], s["err"]))
+
+
+if __name__ == "__main__":
+    main()
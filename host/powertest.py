@@ -0,0 +1,182 @@
+"""Host test of the power saving cycle of power.py.
+
+Runs on the Pycopy (or MicroPython) unix port with the stand-ins of
+host/run.py. Deep sleep is simulated: a stub machine module advances a
+simulated time.time() and ends every "boot" with an exception, and the RTC
+memory is kept in a stub shared by the boots. Checks:
+  - the wake/sample/sleep cycle of early_boot() up to the next server window
+  - the samples batched in RTC memory, read back through PowerState.load()
+  - their drain into the ring by PowerManager, ahead of the live samples
+  - that in light sleep every nap ends with a sample taken before the next
+Exits with status 1 if a check failed. From the repository root:
+
+    pycopy host/powertest.py
+"""
+import sys
+
+sys.path.insert(0, "lib")
+sys.path.insert(0, "")
+
+for name in ("machine", "camera", "dht", "esp", "esp32", "network"):
+    sys.modules[name] = __import__("fake_" + name)
+
+import machine
+import time
+import uasyncio as asyncio
+import power
+import sensors
+
+failures = []
+
+
+def check(name, ok):
+    print("ok  " if ok else "FAIL", name)
+    if not ok:
+        failures.append(name)
+
+
+class SimTime:
+    # time for power.py: time.time() only advances in the simulated deep
+    # sleeps, the ticks are the real ones
+
+    def __init__(self, t):
+        self.t = t
+        self.ticks_ms = time.ticks_ms
+        self.ticks_add = time.ticks_add
+        self.ticks_diff = time.ticks_diff
+
+    def time(self):
+        return self.t
+
+
+class DeepSleep(Exception):
+    pass
+
+
+class RTC:
+
+    def __init__(self):
+        self.data = b""
+
+    def memory(self, data=None):
+        if data is None:
+            return self.data
+        self.data = bytes(data)
+
+
+class SimMachine:
+    # machine for power.py
+
+    def __init__(self, clock, rtc):
+        for name in power.CAUSES:
+            setattr(self, name, getattr(machine, name))
+        self.clock = clock
+        self.rtc = rtc
+        self.cause = machine.PWRON_RESET
+        self.deep_sleeps = []
+        self.light_sleeps = []
+        self.sampler = None
+
+    def RTC(self):
+        return self.rtc
+
+    def reset_cause(self):
+        return self.cause
+
+    def deepsleep(self, ms):
+        # The next call of early_boot() is the wake up
+        self.deep_sleeps.append(ms)
+        self.clock.t += ms // 1000
+        self.cause = machine.DEEPSLEEP_RESET
+        raise DeepSleep
+
+    def lightsleep(self, ms):
+        self.light_sleeps.append(self.sampler.ring.seq)
+        time.sleep_ms(ms)
+
+
+def test_deep_sleep(m, rtc):
+    clock = m.clock
+    st = power.early_boot(rtc)
+    check("power on boots", st.count == 0 and st.causes[0] == 1)
+    # End of a server window in sleep mode, as PowerManager.run() does it
+    st.mode = power.MODE_SLEEP
+    start = clock.t
+    st.next_window = start + (power.CYCLE_MS - power.AWAKE_MS) // 1000
+    st.save(rtc)
+    try:
+        m.deepsleep(power.SLEEP_SAMPLE_MS)
+    except DeepSleep:
+        pass
+    boots = 0
+    while True:
+        boots += 1
+        try:
+            st = power.early_boot(rtc)
+            break
+        except DeepSleep:
+            pass
+    n = (power.CYCLE_MS - power.AWAKE_MS) // power.SLEEP_SAMPLE_MS
+    check("a sample per wake", boots == n and st.count == n and st.wakes == n)
+    check("sleeps until the window", m.deep_sleeps == [power.SLEEP_SAMPLE_MS] * n
+          and clock.t == st.next_window)
+    check("wakes counted as deep sleep resets", st.causes[power.CAUSES.index("DEEPSLEEP_RESET")] == n)
+    times = [rec[0] for rec in st.records()]
+    check("samples a sleep apart", times == [start + (i + 1) * power.SLEEP_SAMPLE_MS // 1000 for i in range(n)])
+    # RTC memory round trip
+    st2 = power.PowerState()
+    check("RTC memory loads", st2.load(rtc))
+    check("batch survives the round trip", list(st2.records()) == list(st.records())
+          and st2.mode == power.MODE_SLEEP and st2.wakes == n)
+    return st, times
+
+
+def ring_times(ring):
+    return [ring.time[ring.index(s)] for s in range(ring.oldest(), ring.seq + 1)]
+
+
+def test_drain(st, times, m, rtc):
+    ring = sensors.SampleRing()
+    sampler = sensors.Sampler(ring)
+    # Set up as main.py does it: the power manager, then the sampler task
+    pm = power.PowerManager(st, sampler, rtc)
+    check("batch drained into the ring", ring_times(ring) == times)
+    st2 = power.PowerState()
+    st2.load(rtc)
+    check("drained batch cleared in RTC memory", st.count == 0 and st2.count == 0)
+    # Short samples to keep the test short
+    sampler.period_ms = 100
+    loop = asyncio.get_event_loop()
+    loop.create_task(sampler.run())
+    loop.run_until_complete(asyncio.sleep_ms(50))
+    t = ring_times(ring)
+    check("live sample after the batch", ring.seq == len(times) + 1
+          and all(t[i] <= t[i + 1] for i in range(len(t) - 1)))
+    return pm
+
+
+def test_light_sleep(pm, m):
+    sampler = pm.sampler
+    m.sampler = sampler
+    pm.state.forced = power.MODE_SAVE
+    pm.set_mode(power.MODE_SAVE)
+    sampler.period_ms = 100
+    # The sampler task started by test_drain() is still running
+    asyncio.get_event_loop().run_until_complete(pm.light_sleep(1000))
+    seqs = m.light_sleeps
+    check("light sleeps between samples", len(seqs) >= 5)
+    check("a sample before every nap", all(seqs[i + 1] == seqs[i] + 1 for i in range(len(seqs) - 1)))
+
+
+# Deep sleep ends before the live samples, which take the real time.time()
+clock = SimTime(time.time() - 3600)
+rtc = RTC()
+m = SimMachine(clock, rtc)
+power.time = clock
+power.machine = m
+st, times = test_deep_sleep(m, rtc)
+pm = test_drain(st, times, m, rtc)
+power.time = time
+test_light_sleep(pm, m)
+print("%d check(s) failed" % len(failures) if failures else "all checks passed")
+sys.exit(1 if failures else 0)
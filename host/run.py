@@ -0,0 +1,25 @@
+"""Run the ground-station server on a Linux host.
+
+Uses the Pycopy (or MicroPython) unix port and replaces the ESP32 only
+modules (machine, camera, dht, esp, esp32, network) with the stand-ins in
+this directory, so the web server, its concurrency and the dashboard can be
+exercised without hardware. From the repository root:
+
+    pycopy host/run.py [port]
+
+and then e.g. `python3 host/loadtest.py http://127.0.0.1:8080/`.
+"""
+import sys
+
+sys.path.insert(0, "lib")
+sys.path.insert(0, "")
+
+for name in ("machine", "camera", "dht", "esp", "esp32", "network"):
+    sys.modules[name] = __import__("fake_" + name)
+
+import main
+
+port = 8080
+if len(sys.argv) > 1:
+    port = int(sys.argv[1])
+main.run(port=port)
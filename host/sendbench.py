@@ -0,0 +1,87 @@
+"""Throughput of picoweb file sending against the send buffer size.
+
+The server side runs on the Pycopy (or MicroPython) unix port and serves a
+generated file with WebApp.sendfile(), using the send buffer size given in
+the query string. The client side runs on CPython and fetches the file with
+each size in turn. From the repository root:
+
+    pycopy host/sendbench.py serve [port]
+    python3 host/sendbench.py fetch http://127.0.0.1:8081/ -s 128,1024,4096 -n 20
+
+Results so far come from a host simulation, not from this script: the
+sendfile() code run under CPython 3.11 with stand-ins for the MicroPython
+modules, writing the 100 KB file to a fake non-blocking socket. "old" is
+sendfile() before the buffer pool (a new 128-byte buffer per call), the
+others take a pooled buffer of that size. Per request:
+
+    buffer         socket takes  readinto  writes  waits  us/req
+    old 128        everything       801      800      0    1633
+    pooled 1024    everything       101      101      0     227
+    pooled 4096    everything        26       26      0      76
+    pooled 8192    everything        14       14      0      52
+    old 128        2920 B/write     801      800      0    1633
+    pooled 4096    2920 B/write      26       51     25      98
+
+"waits" counts the returns to the scheduler after a partial write. Times
+are CPython's and only show the ratio.
+"""
+import sys
+
+FILE_NAME = "sendbench.bin"
+FILE_SIZE = 100 * 1024
+
+
+def serve(port):
+    sys.path.insert(0, "lib")
+    import os
+    import picoweb
+
+    def getfile(req, resp):
+        req.parse_qs()
+        app.send_bufsz = int(req.form.get("bufsz", picoweb.SEND_BUFSZ))
+        yield from app.sendfile(resp, FILE_NAME, "application/octet-stream",
+                                {"Content-Length": str(FILE_SIZE)})
+
+    app = picoweb.WebApp(None, [("/file", getfile)], serve_static=False)
+    chunk = bytes(range(256)) * 16
+    with open(FILE_NAME, "wb") as f:
+        for i in range(FILE_SIZE // len(chunk)):
+            f.write(chunk)
+    try:
+        app.run(host="127.0.0.1", port=port, debug=-1)
+    finally:
+        os.remove(FILE_NAME)
+
+
+def fetch(argv):
+    import argparse
+    import time
+    import urllib.request
+
+    p = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    p.add_argument("base", help="server URL, e.g. http://127.0.0.1:8081/")
+    p.add_argument("-s", "--sizes", default="128,512,1024,2048,4096,8192")
+    p.add_argument("-n", "--requests", type=int, default=20)
+    args = p.parse_args(argv)
+
+    base = args.base.rstrip("/") + "/"
+    print("%8s %10s %10s" % ("bufsz", "KB/s", "ms/req"))
+    for bufsz in [int(s) for s in args.sizes.split(",")]:
+        url = base + "file?bufsz=%d" % bufsz
+        total = 0
+        start = time.time()
+        for i in range(args.requests):
+            with urllib.request.urlopen(url, timeout=30) as f:
+                total += len(f.read())
+        elapsed = time.time() - start
+        if total != args.requests * FILE_SIZE:
+            print("%8d short response: %d bytes" % (bufsz, total))
+            continue
+        print("%8d %10.0f %10.1f" % (bufsz, total / 1024 / elapsed, elapsed * 1000 / args.requests))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "fetch":
+        fetch(sys.argv[2:])
+    else:
+        serve(int(sys.argv[2]) if len(sys.argv) > 2 else 8081)
@@ -0,0 +1,86 @@
+"""Smoke test of the host mode of the ground-station server.
+
+Runs the server of host/run.py on the Pycopy (or MicroPython) unix port,
+requests the dashboard and a static asset over a real socket and checks the
+answers. Exits with status 1 if a check failed. From the repository root:
+
+    pycopy host/smoketest.py
+"""
+import sys
+
+sys.path.insert(0, "lib")
+sys.path.insert(0, "")
+
+for name in ("machine", "camera", "dht", "esp", "esp32", "network"):
+    sys.modules[name] = __import__("fake_" + name)
+
+import ubinascii
+import uasyncio as asyncio
+import main
+
+PORT = 8089
+failures = []
+
+
+def check(name, ok):
+    print("ok  " if ok else "FAIL", name)
+    if not ok:
+        failures.append(name)
+
+
+def get(path, headers=""):
+    # HTTP/1.0, so the server closes the connection after the response
+    reader, writer = yield from asyncio.open_connection("127.0.0.1", PORT)
+    yield from writer.awrite("GET %s HTTP/1.0\r\n%s\r\n" % (path, headers))
+    status = (yield from reader.readline()).split(b" ")[1]
+    hdrs = {}
+    while True:
+        l = yield from reader.readline()
+        if l in (b"\r\n", b""):
+            break
+        k, v = l.split(b":", 1)
+        hdrs[k.lower()] = v.strip()
+    body = b""
+    while True:
+        data = yield from reader.read(4096)
+        if not data:
+            break
+        body += data
+    yield from writer.aclose()
+    return status, hdrs, body
+
+
+def test():
+    # Let the server start listening
+    yield from asyncio.sleep_ms(200)
+    try:
+        status, hdrs, body = yield from get("/")
+        check("/ is 200", status == b"200")
+        check("/ is the dashboard", b"<html" in body.lower())
+        html = body
+        check("/ has an ETag", b"etag" in hdrs)
+        etag = hdrs.get(b"etag", b"").decode()
+        status, hdrs, body = yield from get("/", "If-None-Match: %s\r\n" % etag)
+        check("/ revalidates with 304", status == b"304" and not body)
+        status, hdrs, body = yield from get("/", "Accept-Encoding: gzip\r\n")
+        check("/ is sent gzip-compressed", status == b"200" and hdrs.get(b"content-encoding") == b"gzip")
+        # The gzip trailer holds the CRC-32 and size of the uncompressed data
+        check("/ gzip-compressed is the current dashboard",
+              body[-8:] == (ubinascii.crc32(html) & 0xffffffff).to_bytes(4, "little")
+              + len(html).to_bytes(4, "little"))
+        status, hdrs, body = yield from get("/static/highcharts-11.4.6.js")
+        check("/static/ asset is 200", status == b"200" and len(body) == int(hdrs[b"content-length"]))
+        status, hdrs, body = yield from get("/static/missing.js")
+        check("missing asset is 404", status == b"404")
+        status, hdrs, body = yield from get("/getsensor")
+        check("/getsensor is 200", status == b"200")
+    except Exception as e:
+        check("requests: %r" % e, False)
+    yield asyncio.StopLoop(0)
+
+
+loop = asyncio.get_event_loop(main.RUNQ_LEN, main.WAITQ_LEN)
+loop.create_task(test())
+main.run(host="127.0.0.1", port=PORT, debug=-1)
+print("%d check(s) failed" % len(failures) if failures else "all checks passed")
+sys.exit(1 if failures else 0)
@@ -0,0 +1,23 @@
+import time
+
+import bootprof
+
+
+class Lazy:
+    """! @brief A driver or module created by `factory` on the first get().
+    Keeps hardware setup and heavy imports out of the boot path; the time
+    the factory took is recorded in bootprof.first_use.
+    """
+
+    def __init__(self, name, factory):
+        self.name = name
+        self.factory = factory
+        self.obj = None
+
+    def get(self):
+        obj = self.obj
+        if obj is None:
+            start = time.ticks_ms()
+            obj = self.obj = self.factory()
+            bootprof.first_use.append((self.name, time.ticks_diff(time.ticks_ms(), start)))
+        return obj
@@ -8,12 +8,24 @@ import utime
 import uio
 import ure as re
 import uerrno
+import ubinascii
 import uasyncio as asyncio
 import pkg_resources
 
 from .utils import parse_qs
+from .router import Router, parse_request_line
 
-SEND_BUFSZ = 128
+# Default size of the buffers files are sent with. A flash sector of the
+# ESP32, so that every readinto() of a file reads whole sectors.
+SEND_BUFSZ = 4096
+# Send buffers kept by a WebApp for reuse
+SEND_POOL = 2
+SEND_CHUNKSZ = 2048
+KEEPALIVE_TIMEOUT_MS = 5000
+# Longest wait for the socket of one receive or write on a connection
+READ_TIMEOUT_MS = 10000
+WRITE_TIMEOUT_MS = 10000
+KEEPALIVE_MAX = 100
 
 
 def get_mime_type(fname):
@@ -21,14 +33,20 @@ def get_mime_type(fname):
     # types to keep browsers happy
     if fname.endswith(".html"):
         return "text/html"
+    if fname.endswith(".json"):
+        return "application/json"
     if fname.endswith(".css"):
         return "text/css"
+    if fname.endswith(".js"):
+        return "application/javascript"
     if fname.endswith(".png") or fname.endswith(".jpg"):
         return "image"
     return "text/plain"
 
-def sendstream(writer, f):
-    buf = bytearray(SEND_BUFSZ)
+def sendstream(writer, f, buf=None):
+    # Send the file f, read in pieces of len(buf) bytes
+    if buf is None:
+        buf = bytearray(SEND_BUFSZ)
     while True:
         l = f.readinto(buf)
         if not l:
@@ -36,31 +54,66 @@ def sendstream(writer, f):
         yield from writer.awrite(buf, 0, l)
 
 
+def sendbuffer(writer, buf, chunksz=SEND_CHUNKSZ):
+    # Send an in-memory buffer (e.g. a camera frame) in chunks, giving other
+    # tasks a chance to run in between. Chunks are passed to awrite() as
+    # offset/size into the original buffer, so it's never copied.
+    sz = len(buf)
+    off = 0
+    while off < sz:
+        n = sz - off
+        if n > chunksz:
+            n = chunksz
+        yield from writer.awrite(buf, off, n)
+        off += n
+        yield
+
+
 def jsonify(writer, dict):
     import ujson
-    yield from start_response(writer, "application/json")
-    yield from writer.awrite(ujson.dumps(dict))
+    body = ujson.dumps(dict).encode()
+    yield from start_response(writer, "application/json", headers={"Content-Length": str(len(body))})
+    yield from writer.awrite(body)
+
+def _has_length(status, headers):
+    # Whether the client can find the end of the response without the
+    # connection being closed
+    if str(status)[:3] in ("204", "304"):
+        return True
+    if not headers:
+        return False
+    if isinstance(headers, bytes):
+        return b"Content-Length" in headers
+    return "Content-Length" in headers
 
 def start_response(writer, content_type="text/html; charset=utf-8", status="200", headers=None):
-    yield from writer.awrite("HTTP/1.0 %s NA\r\n" % status)
-    yield from writer.awrite("Content-Type: ")
-    yield from writer.awrite(content_type)
-    if not headers:
-        yield from writer.awrite("\r\n\r\n")
-        return
-    yield from writer.awrite("\r\n")
-    if isinstance(headers, bytes) or isinstance(headers, str):
-        yield from writer.awrite(headers)
+    # The headers are only staged in the writer's buffer. They go out
+    # with the first part of the body, or are flushed by _handle() at the
+    # end of the request.
+    writer.write("HTTP/1.1 %s NA\r\nContent-Type: " % status)
+    writer.write(content_type)
+    # _handle() sets writer.keepalive if the client wants a persistent
+    # connection. It's only kept if this response is delimited.
+    if getattr(writer, "keepalive", False) and _has_length(status, headers):
+        writer.write("\r\nConnection: keep-alive\r\n")
     else:
-        for k, v in headers.items():
-            yield from writer.awrite(k)
-            yield from writer.awrite(": ")
-            yield from writer.awrite(v)
-            yield from writer.awrite("\r\n")
-    yield from writer.awrite("\r\n")
+        writer.keepalive = False
+        writer.write("\r\nConnection: close\r\n")
+    if headers:
+        if isinstance(headers, bytes) or isinstance(headers, str):
+            writer.write(headers)
+        else:
+            for k, v in headers.items():
+                writer.write(k)
+                writer.write(": ")
+                writer.write(v)
+                writer.write("\r\n")
+    writer.write("\r\n")
+    return
+    yield
 
 def http_error(writer, status):
-    yield from start_response(writer, status=status)
+    yield from start_response(writer, status=status, headers={"Content-Length": str(len(status))})
     yield from writer.awrite(status)
 
 
@@ -79,6 +132,21 @@ class HTTPRequest:
         form = parse_qs(self.qs)
         self.form = form
 
+    def get_header(self, name, default=None):
+        # Header names are case-insensitive, but stored as sent by the
+        # client. name is bytes, e.g. b"If-None-Match".
+        headers = getattr(self, "headers", None)
+        if not headers:
+            return default
+        v = headers.get(name)
+        if v is not None:
+            return v
+        name = name.lower()
+        for k, v in headers.items():
+            if k.lower() == name:
+                return v
+        return default
+
 
 class WebApp:
 
@@ -93,11 +161,33 @@ class WebApp:
             self.pkg = None
         if serve_static:
             self.url_map.append((re.compile("^/(static/.+)"), self.handle_static))
+        # Built from url_map, entries appended to it later are picked up
+        # on the next request.
+        self.router = Router()
+        self.routed = 0
         self.mounts = []
         self.inited = False
+        # (ETag, size) of files served by sendasset(), computed on first use
+        self.assets = {}
+        # Cache-Control of files under static/. Set it to e.g.
+        # "public, max-age=31536000, immutable" if their names carry a version.
+        self.static_cache_control = "no-cache"
         # Instantiated lazily
         self.template_loader = None
         self.headers_mode = "parse"
+        # Persistent connections: idle time allowed between requests and
+        # number of requests served on one connection
+        self.keepalive_timeout = KEEPALIVE_TIMEOUT_MS
+        self.keepalive_max = KEEPALIVE_MAX
+        # A receive or write of a connection waiting for the socket longer
+        # than this raises asyncio.TimeoutError, 0 to wait forever. The
+        # connection is then closed without an error response.
+        self.read_timeout = READ_TIMEOUT_MS
+        self.write_timeout = WRITE_TIMEOUT_MS
+        # Buffers of send_bufsz bytes for sending files, see get_sendbuf()
+        self.send_bufsz = SEND_BUFSZ
+        self.send_pool = []
+        self.send_allocs = 0
 
     def parse_headers(self, reader):
         headers = {}
@@ -113,26 +203,66 @@ class WebApp:
         if self.debug > 1:
             micropython.mem_info()
 
+        # Serve requests on the connection until the client or a response
+        # asks to close it, it was idle for keepalive_timeout ms, or it has
+        # served keepalive_max requests.
+        reader.set_timeout(self.read_timeout)
+        writer.set_timeout(self.write_timeout)
+        n = 0
+        close = True
+        try:
+            while close is True:
+                n += 1
+                writer.keepalive = False
+                close = yield from self._handle_request(reader, writer, n)
+                try:
+                    # Send what the response left in the writer's buffer
+                    yield from writer.aflush()
+                except (OSError, asyncio.TimeoutError):
+                    writer.keepalive = False
+                if close is True and not writer.keepalive:
+                    break
+        except (OSError, asyncio.TimeoutError):
+            # The client went away or stalled, e.g. while handle_exc()
+            # answered
+            pass
+        finally:
+            # Unless the handler took over the connection, it's closed
+            # whatever happened
+            if close is not False:
+                try:
+                    yield from writer.aclose()
+                except (OSError, asyncio.TimeoutError):
+                    pass
+
+    def _handle_request(self, reader, writer, n):
+        # Serve the n-th request on a connection. Returns False if the
+        # handler took over the connection, True otherwise.
         close = True
         req = None
         try:
-            request_line = yield from reader.readline()
+            if n == 1:
+                request_line = yield from reader.readline()
+            else:
+                # Idle between requests
+                reader.set_timeout(self.keepalive_timeout)
+                try:
+                    request_line = yield from reader.readline()
+                except asyncio.TimeoutError:
+                    return True
+                reader.set_timeout(self.read_timeout)
             if request_line == b"":
-                if self.debug >= 0:
+                if self.debug >= 0 and n == 1:
                     self.log.error("%s: EOF on request start" % reader)
-                yield from writer.aclose()
-                return
+                return True
             req = HTTPRequest()
-            # TODO: bytes vs str
-            request_line = request_line.decode()
-            method, path, proto = request_line.split()
+            try:
+                method, path, qs, proto = parse_request_line(request_line)
+            except ValueError:
+                yield from http_error(writer, "400")
+                return True
             if self.debug >= 0:
                 self.log.info('%.3f %s %s "%s %s"' % (utime.time(), req, writer, method, path))
-            path = path.split("?", 1)
-            qs = ""
-            if len(path) > 1:
-                qs = path[1]
-            path = path[0]
 
             #print("================")
             #print(req, writer)
@@ -159,44 +289,59 @@ class WebApp:
             if not app.inited:
                 app.init()
 
-            # Find handler to serve this request in app's url_map
-            found = False
-            for e in app.url_map:
-                pattern = e[0]
-                handler = e[1]
-                extra = {}
-                if len(e) > 2:
-                    extra = e[2]
-
-                if path == pattern:
-                    found = True
-                    break
-                elif not isinstance(pattern, str):
-                    # Anything which is non-string assumed to be a ducktype
-                    # pattern matcher, whose .match() method is called. (Note:
-                    # Django uses .search() instead, but .match() is more
-                    # efficient and we're not exactly compatible with Django
-                    # URL matching anyway.)
-                    m = pattern.match(path)
-                    if m:
-                        req.url_match = m
-                        found = True
-                        break
+            # Find handler to serve this request in app's routes
+            found = app.find_route(path)
+            if found:
+                handler, extra, match = found
+                if isinstance(match, dict):
+                    req.params = match
+                elif match is not None:
+                    req.url_match = match
 
             if not found:
                 headers_mode = "skip"
             else:
                 headers_mode = extra.get("headers", self.headers_mode)
 
+            # Whether the client asked for a persistent connection. Requests
+            # with a body are answered with close, as the handler may not
+            # consume the body.
+            keepalive = None
             if headers_mode == "skip":
+                # Lines are looked at in the reader's buffer, only the
+                # ones starting with "c" or "t" are copied. A line longer
+                # than the buffer comes in pieces, only the first one is
+                # looked at.
+                bol = True
                 while True:
-                    l = yield from reader.readline()
-                    if l == b"\r\n":
+                    l = yield from reader.readline_view()
+                    if not l:
                         break
+                    first = bol
+                    bol = l[-1] == 0x0a
+                    if not first:
+                        continue
+                    if len(l) <= 2 and bol:
+                        break
+                    if keepalive is not False and l[0] | 0x20 in (0x63, 0x74):
+                        k = bytes(l[:16]).lower()
+                        if k.startswith(b"connection:"):
+                            keepalive = b"close" not in bytes(l).lower()
+                        elif k.startswith(b"content-length:") or k.startswith(b"transfer-encod"):
+                            keepalive = False
             elif headers_mode == "parse":
                 req.headers = yield from self.parse_headers(reader)
+                conn = req.get_header(b"Connection")
+                if conn is not None:
+                    keepalive = b"close" not in conn.lower()
+                if req.get_header(b"Content-Length", b"0") != b"0" or req.get_header(b"Transfer-Encoding"):
+                    keepalive = False
             else:
                 assert headers_mode == "leave"
+                keepalive = False
+            if keepalive is None:
+                keepalive = proto == "HTTP/1.1"
+            writer.keepalive = keepalive and n < self.keepalive_max
 
             if found:
                 req.method = method
@@ -204,19 +349,38 @@ class WebApp:
                 req.qs = qs
                 req.reader = reader
                 close = yield from handler(req, writer)
+                if close is not False:
+                    close = True
             else:
-                yield from start_response(writer, status="404")
+                yield from start_response(writer, status="404", headers={"Content-Length": "5"})
                 yield from writer.awrite("404\r\n")
             #print(req, "After response write")
+        except asyncio.TimeoutError:
+            # The client stalled: not an error of the app, and there's no
+            # point in sending it an error response
+            if self.debug >= 0:
+                self.log.warning("%.3f %s %s timed out" % (utime.time(), req, writer))
+            writer.keepalive = False
+            close = True
         except Exception as e:
             if self.debug >= 0:
                 self.log.exc(e, "%.3f %s %s %r" % (utime.time(), req, writer, e))
+            writer.keepalive = False
             yield from self.handle_exc(req, writer, e)
+            close = True
 
-        if close is not False:
-            yield from writer.aclose()
         if __debug__ and self.debug > 1:
             self.log.debug("%.3f %s Finished processing request", utime.time(), req)
+        return close
+
+    def find_route(self, path):
+        # Returns (handler, extra, match) for path, or None
+        url_map = self.url_map
+        while self.routed < len(url_map):
+            e = url_map[self.routed]
+            self.router.add(e[0], e[1], e[2] if len(e) > 2 else None)
+            self.routed += 1
+        return self.router.match(path)
 
     def handle_exc(self, req, resp, e):
         # Can be overriden by subclasses. req may be not (fully) initialized.
@@ -269,26 +433,123 @@ class WebApp:
         tmpl = self._load_template(tmpl_name)
         return ''.join(tmpl(*args))
 
+    def get_sendbuf(self):
+        # Take a buffer of send_bufsz bytes from the pool, allocating one
+        # if it's empty. Give it back with put_sendbuf().
+        pool = self.send_pool
+        while pool:
+            buf = pool.pop()
+            # send_bufsz may have been changed since
+            if len(buf) == self.send_bufsz:
+                return buf
+        self.send_allocs += 1
+        return bytearray(self.send_bufsz)
+
+    def put_sendbuf(self, buf):
+        if len(buf) == self.send_bufsz and len(self.send_pool) < SEND_POOL:
+            self.send_pool.append(buf)
+
     def sendfile(self, writer, fname, content_type=None, headers=None):
         if not content_type:
             content_type = get_mime_type(fname)
         try:
             with pkg_resources.resource_stream(self.pkg, fname) as f:
                 yield from start_response(writer, content_type, "200", headers)
-                yield from sendstream(writer, f)
+                # The headers staged by start_response() go out with the
+                # start of the first piece, filling the writer's buffer
+                # (WRITE_BUFSZ). The rest of that piece and the following
+                # ones are written straight from buf.
+                buf = self.get_sendbuf()
+                try:
+                    yield from sendstream(writer, f, buf)
+                finally:
+                    self.put_sendbuf(buf)
         except OSError as e:
             if e.args[0] == uerrno.ENOENT:
                 yield from http_error(writer, "404")
             else:
                 raise
 
+    def asset_info(self, fname):
+        info = self.assets.get(fname)
+        if info is None:
+            crc = 0
+            size = 0
+            buf = self.get_sendbuf()
+            try:
+                with pkg_resources.resource_stream(self.pkg, fname) as f:
+                    while True:
+                        l = f.readinto(buf)
+                        if not l:
+                            break
+                        crc = ubinascii.crc32(memoryview(buf)[:l], crc)
+                        size += l
+                info = ('"%x-%08x"' % (size, crc & 0xffffffff), size)
+            except OSError as e:
+                if e.args[0] != uerrno.ENOENT:
+                    raise
+                info = False
+            finally:
+                self.put_sendbuf(buf)
+            self.assets[fname] = info
+        return info
+
+    def gzip_info(self, fname):
+        # asset_info() of fname + ".gz", False if it's missing or wasn't
+        # built from the current fname. The gzip trailer holds the CRC-32
+        # and size of the uncompressed data, which make up the ETag of
+        # fname. If fname itself is missing, the .gz is taken as is.
+        gz = fname + ".gz"
+        if gz in self.assets:
+            return self.assets[gz]
+        info = self.asset_info(gz)
+        src = self.asset_info(fname)
+        if info and src:
+            with pkg_resources.resource_stream(self.pkg, gz) as f:
+                f.seek(-8, 2)
+                t = f.read(8)
+            if src[0] != '"%x-%08x"' % (int.from_bytes(t[4:], "little"), int.from_bytes(t[:4], "little")):
+                if self.debug >= 0:
+                    self.log.warning("%s is stale, serving %s" % (gz, fname))
+                info = self.assets[gz] = False
+        return info
+
+    def sendasset(self, req, writer, fname, content_type=None, cache_control="no-cache"):
+        # Send a file which doesn't change while the app runs, using
+        # fname + ".gz" with Content-Encoding: gzip if it's up to date (see
+        # gzip_info()) and the client accepts it. Answers conditional
+        # requests matching the file's ETag with 304 Not Modified.
+        if not content_type:
+            content_type = get_mime_type(fname)
+        headers = {"Cache-Control": cache_control, "Vary": "Accept-Encoding"}
+        info = None
+        accept = req.get_header(b"Accept-Encoding")
+        if accept and b"gzip" in accept:
+            info = self.gzip_info(fname)
+            if info:
+                fname += ".gz"
+                headers["Content-Encoding"] = "gzip"
+        if not info:
+            info = self.asset_info(fname)
+        if not info:
+            yield from http_error(writer, "404")
+            return
+        etag, size = info
+        headers["ETag"] = etag
+        inm = req.get_header(b"If-None-Match")
+        if inm and etag.encode() in inm:
+            yield from start_response(writer, content_type, "304", headers)
+            return
+        headers["Content-Length"] = str(size)
+        yield from self.sendfile(writer, fname, content_type, headers)
+
     def handle_static(self, req, resp):
         path = req.url_match.group(1)
         print(path)
         if ".." in path:
             yield from http_error(resp, "403")
             return
-        yield from self.sendfile(resp, path)
+        yield from self.sendasset(req, resp, path, cache_control=self.static_cache_control)
 
     def init(self):
         """Initialize a web application. This is for overriding by subclasses.
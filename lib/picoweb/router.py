@@ -0,0 +1,104 @@
+# Request line parsing and URL routing for picoweb
+# SPDX-License-Identifier: MIT
+
+
+def parse_request_line(line):
+    # Split b"GET /path?qs HTTP/1.1\r\n" into ("GET", "/path", "qs", "HTTP/1.1").
+    # Raises ValueError if the line is not a request line.
+    method, target, proto = line.decode().split()
+    i = target.find("?")
+    if i < 0:
+        return method, target, "", proto
+    return method, target[:i], target[i + 1:], proto
+
+
+# Index of fields in a prefix tree node
+_CHILDREN = 0
+_PARAM = 1
+_PARAM_NODE = 2
+_ENDPOINT = 3
+
+
+def _node():
+    # [literal segment -> node, param name, node for the param, (handler, extra)]
+    return [{}, None, None, None]
+
+
+class Router:
+    """Maps request paths to handlers.
+
+    Three kinds of patterns are supported:
+    * plain strings, e.g. "/getsolar", looked up in a dict;
+    * strings with parameter segments, e.g. "/log/<day>", compiled into a
+      prefix tree of path segments. Parameters are returned as a dict;
+    * anything else is a ducktype matcher (usually a compiled regex) whose
+      .match() is tried in registration order, returning the match object.
+    Exact paths win over parameterized ones, which win over matchers.
+    """
+
+    def __init__(self):
+        self.exact = {}
+        self.tree = _node()
+        self.matchers = []
+
+    def add(self, pattern, handler, extra=None):
+        if extra is None:
+            extra = {}
+        if not isinstance(pattern, str):
+            self.matchers.append((pattern, handler, extra))
+        elif "<" not in pattern:
+            # First registration wins, as with a linear scan
+            if pattern not in self.exact:
+                self.exact[pattern] = (handler, extra)
+        else:
+            node = self.tree
+            for seg in pattern.split("/")[1:]:
+                if seg[:1] == "<" and seg[-1:] == ">":
+                    name = seg[1:-1]
+                    if node[_PARAM_NODE] is None:
+                        node[_PARAM] = name
+                        node[_PARAM_NODE] = _node()
+                    elif node[_PARAM] != name:
+                        raise ValueError("conflicting parameter names: %s" % pattern)
+                    node = node[_PARAM_NODE]
+                else:
+                    child = node[_CHILDREN].get(seg)
+                    if child is None:
+                        child = node[_CHILDREN][seg] = _node()
+                    node = child
+            if node[_ENDPOINT] is None:
+                node[_ENDPOINT] = (handler, extra)
+
+    def match(self, path):
+        # Returns (handler, extra, params) or None. params is a dict for
+        # parameterized routes, the match object for matchers, else None.
+        e = self.exact.get(path)
+        if e is not None:
+            return e[0], e[1], None
+        if self.tree[_CHILDREN] or self.tree[_PARAM_NODE]:
+            params = {}
+            e = self._walk(self.tree, path.split("/"), 1, params)
+            if e is not None:
+                return e[0], e[1], params
+        for pattern, handler, extra in self.matchers:
+            m = pattern.match(path)
+            if m:
+                return handler, extra, m
+        return None
+
+    def _walk(self, node, segs, i, params):
+        if i == len(segs):
+            return node[_ENDPOINT]
+        seg = segs[i]
+        child = node[_CHILDREN].get(seg)
+        if child is not None:
+            e = self._walk(child, segs, i + 1, params)
+            if e is not None:
+                return e
+        child = node[_PARAM_NODE]
+        if child is not None and seg:
+            e = self._walk(child, segs, i + 1, params)
+            if e is not None:
+                params[node[_PARAM]] = seg
+                return e
+        return None
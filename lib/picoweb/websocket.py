@@ -0,0 +1,150 @@
+# WebSocket (RFC 6455) server connections for picoweb handlers
+# SPDX-License-Identifier: MIT
+import uhashlib
+import ubinascii
+
+from . import http_error
+
+OP_CONT = 0x0
+OP_TEXT = 0x1
+OP_BINARY = 0x2
+OP_CLOSE = 0x8
+OP_PING = 0x9
+OP_PONG = 0xa
+
+CLOSE_NORMAL = 1000
+CLOSE_PROTOCOL_ERROR = 1002
+CLOSE_TOO_BIG = 1009
+
+# Largest incoming message accepted by default. Clients are expected to
+# send small control messages only.
+MAX_PAYLOAD = 128
+
+_GUID = b"258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+
+def accept(req, writer, max_payload=MAX_PAYLOAD):
+    # Complete the opening handshake of a WebSocket request. Returns a
+    # WebSocket, or None if req is not a valid upgrade request (a 400 was
+    # sent then). The handler must have the "parse" headers mode.
+    key = req.get_header(b"Sec-WebSocket-Key")
+    upgrade = req.get_header(b"Upgrade")
+    if not key or not upgrade or upgrade.lower() != b"websocket":
+        yield from http_error(writer, "400")
+        return None
+    d = uhashlib.sha1(key)
+    d.update(_GUID)
+    yield from writer.awrite(b"HTTP/1.1 101 Switching Protocols\r\n"
+                             b"Upgrade: websocket\r\nConnection: Upgrade\r\n"
+                             b"Sec-WebSocket-Accept: " + ubinascii.b2a_base64(d.digest())[:-1] + b"\r\n\r\n")
+    # The connection belongs to the WebSocket now
+    writer.keepalive = False
+    return WebSocket(req.reader, writer, max_payload)
+
+
+class WebSocket:
+    """Server side of a WebSocket connection.
+
+    All buffers are allocated once per connection: incoming payloads are
+    read and unmasked in place in a buffer of max_payload bytes, frame
+    headers are built in a small scratch buffer. Messages larger than
+    max_payload, and fragmented ones, close the connection.
+    """
+
+    def __init__(self, reader, writer, max_payload=MAX_PAYLOAD):
+        self.reader = reader
+        self.writer = writer
+        self.buf = bytearray(max_payload)
+        self.rhdr = bytearray(8)
+        self.whdr = bytearray(10)
+        self.closed = False
+
+    def recv(self):
+        # Return (opcode, payload) of the next text or binary message.
+        # payload is a memoryview into the receive buffer, valid until the
+        # next recv(). Pings are answered here. On close returns
+        # (OP_CLOSE, None) and .closed is set.
+        reader = self.reader
+        hdr = self.rhdr
+        while True:
+            if (yield from reader.readexactly_into(hdr, 2)) < 2:
+                self.closed = True
+                return OP_CLOSE, None
+            fin = hdr[0] & 0x80
+            op = hdr[0] & 0x0f
+            n = hdr[1] & 0x7f
+            masked = hdr[1] & 0x80
+            if n == 126:
+                yield from reader.readexactly_into(hdr, 2)
+                n = (hdr[0] << 8) | hdr[1]
+            elif n == 127:
+                yield from self.close(CLOSE_TOO_BIG)
+                return OP_CLOSE, None
+            if not masked or not fin:
+                # Clients must mask their frames, and we don't reassemble
+                yield from self.close(CLOSE_PROTOCOL_ERROR)
+                return OP_CLOSE, None
+            if n > len(self.buf):
+                yield from self.close(CLOSE_TOO_BIG)
+                return OP_CLOSE, None
+            yield from reader.readexactly_into(hdr, 4)
+            buf = self.buf
+            if (yield from reader.readexactly_into(buf, n)) < n:
+                self.closed = True
+                return OP_CLOSE, None
+            for i in range(n):
+                buf[i] ^= hdr[i & 3]
+            payload = memoryview(buf)[:n]
+
+            if op == OP_PING:
+                yield from self.send(OP_PONG, payload)
+            elif op == OP_PONG:
+                pass
+            elif op == OP_CLOSE:
+                if not self.closed:
+                    yield from self.close(CLOSE_NORMAL)
+                return OP_CLOSE, None
+            else:
+                return op, payload
+
+    def send(self, op, data, off=0, sz=-1):
+        # Send data[off:off + sz] as one unmasked message
+        if sz == -1:
+            sz = len(data) - off
+        yield from self.send_header(op, sz)
+        # Goes out in one piece with the staged header if it fits
+        yield from self.writer.awrite(data, off, sz)
+
+    def send_header(self, op, sz):
+        # Start a message of sz bytes, the caller then writes the payload
+        # to .writer itself (e.g. in several pieces). The header is staged
+        # in the writer's buffer and sent with the first piece.
+        h = self.whdr
+        h[0] = 0x80 | op
+        if sz < 126:
+            h[1] = sz
+            hl = 2
+        elif sz < 0x10000:
+            h[1] = 126
+            h[2] = sz >> 8
+            h[3] = sz & 0xff
+            hl = 4
+        else:
+            h[1] = 127
+            for i in range(8):
+                h[9 - i] = (sz >> (8 * i)) & 0xff
+            hl = 10
+        self.writer.write(h, 0, hl)
+        return
+        yield
+
+    def close(self, code=CLOSE_NORMAL):
+        if self.closed:
+            return
+        self.closed = True
+        h = self.whdr
+        h[0] = 0x80 | OP_CLOSE
+        h[1] = 2
+        h[2] = code >> 8
+        h[3] = code & 0xff
+        yield from self.writer.awrite(h, 0, 4)
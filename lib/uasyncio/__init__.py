@@ -89,6 +89,26 @@ class PollEventLoop(EventLoop):
                 self.call_soon(cb)
 
 
+# Size of the receive buffer of a Stream, allocated on the first read.
+# readline() and readline_view() return longer lines in several pieces.
+READ_BUFSZ = 256
+# Size of the send buffer of a Stream, allocated on the first write().
+# Data staged with write() goes out with the next awrite(), awritev() or
+# aflush(), packed into as few ios.write() calls as possible.
+WRITE_BUFSZ = 1024
+
+if hasattr(bytearray, "find"):
+    def _find_nl(buf, start, end):
+        return buf.find(b"\n", start, end)
+else:
+    def _find_nl(buf, start, end):
+        while start < end:
+            if buf[start] == 0x0a:
+                return start
+            start += 1
+        return -1
+
+
 class Stream:
 
     def __init__(self, polls, ios=None, extra=None):
@@ -97,90 +117,305 @@ class Stream:
         self.polls = polls
         self.ios = ios
         self.extra = extra
+        # Receive buffer, unread data is rbuf[rpos:rend]
+        self.rbuf = None
+        self.rpos = 0
+        self.rend = 0
+        # Send buffer, staged data is wbuf[:wlen], then the buffers in
+        # wmore which didn't fit
+        self.wbuf = None
+        self.wlen = 0
+        self.wmore = None
+        # See set_timeout()
+        self.deadline = None
+        self.timeout_ms = 0
+
+    def set_timeout(self, ms):
+        # Raise TimeoutError in the task reading or writing this stream if
+        # the socket doesn't become ready within ms, 0 to wait forever.
+        # The deadline is per wait: it's armed again for each receive
+        # into the buffer or write to the socket, so a peer trickling data
+        # can keep e.g. a readline() going longer. Uses a Deadline of the
+        # timer wheel, which is reused by all the operations.
+        if ms and self.deadline is None:
+            from uasyncio.wheel import Deadline
+            self.deadline = Deadline()
+        self.timeout_ms = ms
+
+    def _arm(self):
+        # Start the timeout on the first wait for the socket of a
+        # receive or write, it's cancelled when that one is done
+        d = self.deadline
+        if self.timeout_ms and d.slot < 0:
+            d.arm(self.timeout_ms)
+
+    def _disarm(self):
+        if self.deadline is not None:
+            self.deadline.cancel()
+
+    def buffered(self):
+        # Number of bytes received but not read yet. The socket may not
+        # poll as readable while this is not 0.
+        return self.rend - self.rpos
+
+    def _take(self, mv, n):
+        # Copy up to n buffered bytes to mv, return how many were copied
+        avail = self.rend - self.rpos
+        if n > avail:
+            n = avail
+        if n:
+            mv[:n] = memoryview(self.rbuf)[self.rpos:self.rpos + n]
+            self.rpos += n
+        return n
+
+    def _fill(self):
+        # Receive more data into rbuf, moving the unread data to its start
+        # if the end is full. Returns the number of bytes received, 0 on
+        # EOF or if the buffer is full.
+        if self.rbuf is None:
+            self.rbuf = bytearray(READ_BUFSZ)
+        mv = memoryview(self.rbuf)
+        if self.rpos == self.rend:
+            self.rpos = self.rend = 0
+        elif self.rend == len(self.rbuf) and self.rpos:
+            n = self.rend - self.rpos
+            mv[:n] = mv[self.rpos:self.rend]
+            self.rpos = 0
+            self.rend = n
+        if self.rend == len(self.rbuf):
+            return 0
+        try:
+            while True:
+                res = self.ios.readinto(mv[self.rend:])
+                if res is None:
+                    self._arm()
+                    yield IORead(self.polls)
+                elif res is uio.WANT_WRITE:
+                    self._arm()
+                    yield IOWrite(self.polls)
+                else:
+                    break
+        finally:
+            self._disarm()
+        if not res:
+            yield IOReadDone(self.polls)
+            return 0
+        self.rend += res
+        return res
 
     def read(self, n=-1):
-        while True:
-            res = self.ios.read(n)
-            if res is None:
-                yield IORead(self.polls)
-            elif res is uio.WANT_WRITE:
-                yield IOWrite(self.polls)
-            else:
-                break
+        if self.rpos != self.rend:
+            end = self.rend
+            if n >= 0 and self.rpos + n < end:
+                end = self.rpos + n
+            res = bytes(memoryview(self.rbuf)[self.rpos:end])
+            self.rpos = end
+            return res
+        try:
+            while True:
+                res = self.ios.read(n)
+                if res is None:
+                    self._arm()
+                    yield IORead(self.polls)
+                elif res is uio.WANT_WRITE:
+                    self._arm()
+                    yield IOWrite(self.polls)
+                else:
+                    break
+        finally:
+            self._disarm()
         if not res:
             yield IOReadDone(self.polls)
         return res
 
     def readexactly(self, n):
-        buf = b""
-        while n:
-            res = self.ios.read(n)
-            if res is None:
-                yield IORead(self.polls)
-            elif res is uio.WANT_WRITE:
-                yield IOWrite(self.polls)
-            elif not res:
-                yield IOReadDone(self.polls)
-                break
-            else:
-                buf += res
-                n -= len(res)
-                # Give other tasks a chance to run
-                yield
+        if n <= READ_BUFSZ:
+            # Receive into rbuf and copy out once
+            while self.rend - self.rpos < n:
+                if not (yield from self._fill()):
+                    n = self.rend - self.rpos
+                    break
+            res = bytes(memoryview(self.rbuf)[self.rpos:self.rpos + n])
+            self.rpos += n
+            return res
+        buf = bytearray(n)
+        off = yield from self.readexactly_into(buf, n)
+        if off < n:
+            return buf[:off]
         return buf
 
+    def readexactly_into(self, buf, n=-1):
+        # Like readexactly(), but reads into a caller-provided buffer
+        # (buf[:n], all of it by default). Returns the number of bytes
+        # read, less than n only on EOF.
+        if n == -1:
+            n = len(buf)
+        mv = memoryview(buf)
+        off = self._take(mv, n)
+        try:
+            while off < n:
+                res = self.ios.readinto(mv[off:n])
+                if res is None:
+                    self._arm()
+                    yield IORead(self.polls)
+                elif res is uio.WANT_WRITE:
+                    self._arm()
+                    yield IOWrite(self.polls)
+                elif not res:
+                    yield IOReadDone(self.polls)
+                    break
+                else:
+                    off += res
+        finally:
+            self._disarm()
+        return off
+
+    def readline_view(self):
+        # Like readline(), but returns a memoryview into the receive
+        # buffer, valid until the next read from this stream. A line
+        # longer than READ_BUFSZ is returned in several pieces, only the
+        # last one ending with b"\n". Empty on EOF.
+        scan = self.rpos
+        while True:
+            i = _find_nl(self.rbuf, scan, self.rend) if self.rbuf else -1
+            if i >= 0:
+                end = i + 1
+                break
+            scan = self.rend - self.rpos
+            if not (yield from self._fill()):
+                end = self.rend
+                break
+            # _fill() may have moved the data to the start of rbuf
+            scan += self.rpos
+        res = memoryview(self.rbuf)[self.rpos:end]
+        self.rpos = end
+        return res
+
     def readline(self):
         if DEBUG and __debug__:
             log.debug("StreamReader.readline()")
-        buf = b""
-        while True:
-            res = self.ios.readline()
-            if res is None:
-                yield IORead(self.polls)
-            elif res is uio.WANT_WRITE:
-                yield IOWrite(self.polls)
-            elif not res:
-                yield IOReadDone(self.polls)
+        buf = bytes((yield from self.readline_view()))
+        while buf and buf[-1] != 0x0a:
+            # Longer than the receive buffer
+            res = yield from self.readline_view()
+            if not res:
                 break
-            else:
-                buf += res
-                if buf[-1] == 0x0a:
-                    break
-                # Give other tasks a chance to run
-                yield
+            buf += bytes(res)
         if DEBUG and __debug__:
             log.debug("StreamReader.readline(): %s", buf)
         return buf
 
+    def write(self, buf, off=0, sz=-1):
+        # Stage buf[off:off + sz] to be sent later, like .write() of
+        # original asyncio. Not a coroutine: nothing is sent until the
+        # next awrite(), awritev() or aflush().
+        if isinstance(buf, str):
+            buf = buf.encode()
+        if sz == -1:
+            sz = len(buf) - off
+        if self.wbuf is None:
+            self.wbuf = bytearray(WRITE_BUFSZ)
+        end = self.wlen + sz
+        if self.wmore is None and end <= len(self.wbuf):
+            self.wbuf[self.wlen:end] = memoryview(buf)[off:off + sz]
+            self.wlen = end
+        else:
+            if self.wmore is None:
+                self.wmore = []
+            self.wmore.append(bytes(memoryview(buf)[off:off + sz]))
+
+    def aflush(self):
+        # Send the staged data. It's unstaged first, so that it's dropped
+        # rather than sent again (e.g. by aclose()) if sending fails.
+        n = self.wlen
+        more = self.wmore
+        self.wlen = 0
+        self.wmore = None
+        if n:
+            yield from self._awrite(self.wbuf, 0, n)
+        if more:
+            for buf in more:
+                yield from self._awrite(buf, 0, len(buf))
+
+    def _put(self, buf, off, sz):
+        # Stage buf[off:off + sz], sending the buffer each time it fills
+        # up. Data at least as long as the buffer isn't copied if the
+        # buffer is empty.
+        if self.wmore:
+            yield from self.aflush()
+        wbuf = self.wbuf
+        while sz:
+            n = len(wbuf) - self.wlen
+            if not self.wlen and sz >= n:
+                yield from self._awrite(buf, off, sz)
+                return
+            if n > sz:
+                n = sz
+            wbuf[self.wlen:self.wlen + n] = memoryview(buf)[off:off + n]
+            self.wlen += n
+            off += n
+            sz -= n
+            if self.wlen == len(wbuf):
+                yield from self.aflush()
+
+    def awritev(self, bufs):
+        # Send the staged data and then each buffer of the iterable bufs
+        # (bytes, bytearray or str), packed together up to WRITE_BUFSZ
+        # bytes per ios.write() call.
+        if self.wbuf is None:
+            self.wbuf = bytearray(WRITE_BUFSZ)
+        for buf in bufs:
+            if isinstance(buf, str):
+                buf = buf.encode()
+            yield from self._put(buf, 0, len(buf))
+        yield from self.aflush()
+
     def awrite(self, buf, off=0, sz=-1):
         # This method is called awrite (async write) to not proliferate
         # incompatibility with original asyncio. Unlike original asyncio
         # whose .write() method is both not a coroutine and guaranteed
         # to return immediately (which means it has to buffer all the
-        # data), this method is a coroutine.
+        # data), this method is a coroutine. Data staged with write() is
+        # sent first, in the same ios.write() call if it fits.
+        if self.wlen or self.wmore:
+            if isinstance(buf, str):
+                buf = buf.encode()
+            if sz == -1:
+                sz = len(buf) - off
+            yield from self._put(buf, off, sz)
+            yield from self.aflush()
+            return
+        yield from self._awrite(buf, off, sz)
+
+    def _awrite(self, buf, off=0, sz=-1):
         if sz == -1:
             sz = len(buf) - off
         if DEBUG and __debug__:
             log.debug("StreamWriter.awrite(): spooling %d bytes", sz)
-        while sz:
-            res = self.ios.write(buf, off, sz)
-            # If we spooled everything, fast return
-            if res == sz:
-                if DEBUG and __debug__:
-                    log.debug("StreamWriter.awrite(): completed spooling %d bytes", res)
-                return
-            elif res is None:
-                yield IOWrite(self.polls)
-            elif res is uio.WANT_READ:
-                yield IORead(self.polls)
-            else:
-                if DEBUG and __debug__:
-                    log.debug("StreamWriter.awrite(): spooled partial %d bytes", res)
-                assert res != 0 and res < sz
-                off += res
-                sz -= res
-                # Give other tasks a chance to run
-                yield
+        try:
+            while sz:
+                res = self.ios.write(buf, off, sz)
+                # If we spooled everything, fast return
+                if res == sz:
+                    if DEBUG and __debug__:
+                        log.debug("StreamWriter.awrite(): completed spooling %d bytes", res)
+                    return
+                elif res is None:
+                    self._arm()
+                    yield IOWrite(self.polls)
+                elif res is uio.WANT_READ:
+                    self._arm()
+                    yield IORead(self.polls)
+                else:
+                    if DEBUG and __debug__:
+                        log.debug("StreamWriter.awrite(): spooled partial %d bytes", res)
+                    assert res != 0 and res < sz
+                    off += res
+                    sz -= res
+                    # Give other tasks a chance to run
+                    yield
+        finally:
+            self._disarm()
 
     # This function is tentative, subject to change
     def awritestr(self, s):
@@ -192,9 +427,12 @@ class Stream:
             yield from self.awrite(buf)
 
     def aclose(self):
-        yield IOWriteDone(self.polls)
-        self.ios.close()
-        self.polls.close()
+        try:
+            yield from self.aflush()
+        finally:
+            yield IOWriteDone(self.polls)
+            self.ios.close()
+            self.polls.close()
 
     def get_extra_info(self, name, default=None):
         return self.extra.get(name, default)
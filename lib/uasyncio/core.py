@@ -25,11 +25,26 @@ class TimeoutError(CancelledError):
     pass
 
 
+# When runq is full, it's replaced by a deque longer by this many entries
+RUNQ_CHUNK = 16
+
+
 class EventLoop:
 
     def __init__(self, runq_len=16, waitq_len=16):
+        self.runq_len = runq_len
         self.runq = ucollections.deque((), runq_len, True)
         self.waitq = utimeq.utimeq(waitq_len)
+        # utimeq can't grow without invalidating the ids pended to waiting
+        # coroutines, so timers which don't fit go to this list, sorted by
+        # time. Its entries are [time, callback, args, id], ids are < 0.
+        self.spill = []
+        self.spill_id = 0
+        # High-water marks and overflow counters, see stats()
+        self.runq_hwm = 0
+        self.waitq_hwm = 0
+        self.runq_grows = 0
+        self.spilled = 0
         # Current task being run. Task is a top-level coroutine scheduled
         # in the event loop (sub-coroutines executed transparently by
         # yield from/await, event loop "doesn't see" them).
@@ -46,9 +61,32 @@ class EventLoop:
     def call_soon(self, callback, *args):
         if __debug__ and _DEBUG:
             _log.debug("Scheduling in runq: %s", (callback, args))
-        self.runq.append(callback)
+        self.runq_push(callback)
         if not isinstance(callback, type_gen):
-            self.runq.append(args)
+            self.runq_push(args)
+
+    def runq_push(self, v):
+        try:
+            self.runq.append(v)
+        except IndexError:
+            self.grow_runq()
+            self.runq.append(v)
+        n = len(self.runq)
+        if n > self.runq_hwm:
+            self.runq_hwm = n
+
+    def grow_runq(self):
+        # Entries keep their order, so run_forever() can go on popping
+        # from the new deque
+        self.runq_len += RUNQ_CHUNK
+        q = ucollections.deque((), self.runq_len, True)
+        old = self.runq
+        while old:
+            q.append(old.popleft())
+        self.runq = q
+        self.runq_grows += 1
+        if __debug__ and _DEBUG:
+            _log.warning("runq grown to %d", self.runq_len)
 
     def call_later(self, delay, callback, *args):
         self.call_at_(time.ticks_add(self.time(), int(delay * 1000)), callback, args)
@@ -61,10 +99,79 @@ class EventLoop:
     def call_at_(self, time, callback, args=()):
         if __debug__ and _DEBUG:
             _log.debug("Scheduling in waitq: %s", (time, callback, args))
-        id = self.waitq.push(time, callback, args)
+        try:
+            id = self.waitq.push(time, callback, args)
+        except IndexError:
+            id = self.spill_push(time, callback, args)
+        n = len(self.waitq) + len(self.spill)
+        if n > self.waitq_hwm:
+            self.waitq_hwm = n
         if isinstance(callback, type_gen):
             prev = callback.pend_throw(id)
 
+    def spill_push(self, t, callback, args):
+        self.spill_id -= 1
+        q = self.spill
+        lo = 0
+        hi = len(q)
+        # Insert after the entries with the same time, like utimeq
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if time.ticks_diff(t, q[mid][0]) < 0:
+                hi = mid
+            else:
+                lo = mid + 1
+        q.insert(lo, [t, callback, args, self.spill_id])
+        self.spilled += 1
+        if __debug__ and _DEBUG:
+            _log.warning("waitq full, spilled: %s", (t, callback, args))
+        return self.spill_id
+
+    def remove_timer(self, id):
+        # Remove a timer by the id pended to its coroutine
+        if id >= 0:
+            self.waitq.remove(id)
+            return
+        q = self.spill
+        for i in range(len(q)):
+            if q[i][3] == id:
+                del q[i]
+                return
+
+    def spill_first(self):
+        # Whether the earliest timer is in the spill list
+        if not self.spill:
+            return False
+        if not self.waitq:
+            return True
+        return time.ticks_diff(self.spill[0][0], self.waitq.peektime()) < 0
+
+    def peektime(self):
+        if self.spill_first():
+            return self.spill[0][0]
+        return self.waitq.peektime()
+
+    def pop_timer(self, cur_task):
+        if self.spill_first():
+            e = self.spill.pop(0)
+            cur_task[0] = e[0]
+            cur_task[1] = e[1]
+            cur_task[2] = e[2]
+        else:
+            self.waitq.pop(cur_task)
+
+    def stats(self):
+        return {
+            "runq_len": self.runq_len,
+            "runq": len(self.runq),
+            "runq_hwm": self.runq_hwm,
+            "runq_grows": self.runq_grows,
+            "waitq": len(self.waitq),
+            "waitq_hwm": self.waitq_hwm,
+            "spill": len(self.spill),
+            "spilled": self.spilled,
+        }
+
     def wait(self, delay):
         # Default wait implementation, to be overriden in subclasses
         # with IO scheduling
@@ -77,12 +184,12 @@ class EventLoop:
         while True:
             # Expire entries in waitq and move them to runq
             tnow = self.time()
-            while self.waitq:
-                t = self.waitq.peektime()
+            while self.waitq or self.spill:
+                t = self.peektime()
                 delay = time.ticks_diff(t, tnow)
                 if delay > 0:
                     break
-                self.waitq.pop(cur_task)
+                self.pop_timer(cur_task)
 
                 if isinstance(cur_task[1], type_gen):
                     prev = cur_task[1].pend_throw(None)
@@ -173,9 +280,9 @@ class EventLoop:
             delay = 0
             if not self.runq:
                 delay = -1
-                if self.waitq:
+                if self.waitq or self.spill:
                     tnow = self.time()
-                    t = self.waitq.peektime()
+                    t = self.peektime()
                     delay = time.ticks_diff(t, tnow)
                     if delay < 0:
                         delay = 0
@@ -266,13 +373,14 @@ _stop_iter = StopIteration()
 sleep_ms = SleepMs()
 
 
-def cancel(coro):
-    prev = coro.pend_throw(CancelledError())
+def throw(coro, exc):
+    # Raise exc in coro at the point where it waits
+    prev = coro.pend_throw(exc)
     if prev is None:
         pass
     elif isinstance(prev, int):
-        # utimeq id
-        _event_loop.waitq.remove(prev)
+        # utimeq or spill id
+        _event_loop.remove_timer(prev)
         _event_loop.call_soon(coro)
     else:
         # stream obj
@@ -280,6 +388,10 @@ def cancel(coro):
         _event_loop.call_soon(coro)
 
 
+def cancel(coro):
+    throw(coro, CancelledError())
+
+
 class TimeoutObj:
     def __init__(self, coro):
         self.coro = coro
@@ -298,16 +410,7 @@ def wait_for_ms(coro, timeout):
         if timeout_obj.coro:
             if __debug__ and _DEBUG:
                 _log.debug("timeout_func: cancelling %s", timeout_obj.coro)
-            prev = timeout_obj.coro.pend_throw(TimeoutError())
-            #print("prev pend", prev)
-            if prev is None:
-                pass
-            elif isinstance(prev, int):
-                _event_loop.waitq.remove(prev)
-                _event_loop.call_soon(timeout_obj.coro)
-            else:
-                _event_loop.cancel_io(prev)
-                _event_loop.call_soon(timeout_obj.coro)
+            throw(timeout_obj.coro, TimeoutError())
 
     timeout_obj = TimeoutObj(_event_loop.cur_task)
     _event_loop.call_later_ms(timeout, timeout_func, timeout_obj)
@@ -0,0 +1,203 @@
+# Hierarchical timer wheel for per-connection deadlines
+# SPDX-License-Identifier: MIT
+#
+# Arming and cancelling a Deadline links it into or out of a slot list,
+# with no allocation and no search of the event loop's wait queue. Level 0
+# has SLOTS slots of tick_ms, each further level SLOTS slots covering a
+# whole turn of the level below. Entries move down a level ("cascade")
+# when the level below wraps around. The event loop is only woken up for
+# ticks with work: a non-empty level 0 slot or a cascade.
+import utime as time
+
+from uasyncio import core
+
+TICK_MS = 100
+BITS = 5
+SLOTS = 1 << BITS
+MASK = SLOTS - 1
+LEVELS = 3
+# Deadlines further away are parked in the last slot and placed again
+# when they cascade (about 55 minutes with the defaults)
+MAX_TICKS = (1 << (BITS * LEVELS)) - 1
+
+
+class Deadline:
+    # A reusable timeout. arm(ms) makes TimeoutError raise in the calling
+    # task if it's still waiting (on I/O or a sleep) ms later, unless
+    # cancel() is called before.
+
+    def __init__(self, wheel=None):
+        self.wheel = wheel if wheel is not None else get_wheel()
+        self.task = None
+        self.tick = 0
+        # Index of the slot list the deadline is in, -1 if not armed
+        self.slot = -1
+        self.prev = None
+        self.next = None
+
+    def arm(self, ms):
+        if self.slot >= 0:
+            self.wheel.remove(self)
+        self.task = core.get_event_loop().cur_task
+        self.wheel.add(self, ms)
+
+    def cancel(self):
+        if self.slot >= 0:
+            self.wheel.remove(self)
+        self.task = None
+
+    def armed(self):
+        return self.slot >= 0
+
+
+class TimerWheel:
+
+    def __init__(self, tick_ms=TICK_MS):
+        self.tick_ms = tick_ms
+        self.slots = [None] * (SLOTS * LEVELS)
+        # Ticks processed so far, and ticks_ms() of the last one
+        self.now = 0
+        self.base = time.ticks_ms()
+        self.count = 0
+        # Tick _tick() is scheduled for, and the generation number which
+        # invalidates the scheduled call when an earlier one is needed
+        self.wake_tick = None
+        self.gen = 0
+        # Counters
+        self.count_hwm = 0
+        self.fired = 0
+        self.cascaded = 0
+
+    def add(self, d, ms):
+        self.advance()
+        # Round up, counting the part of the current tick already gone
+        ms += time.ticks_diff(time.ticks_ms(), self.base)
+        d.tick = self.now + (ms + self.tick_ms - 1) // self.tick_ms
+        self._link(d)
+        self.count += 1
+        if self.count > self.count_hwm:
+            self.count_hwm = self.count
+        # Wake up for the deadline, or for the cascade that brings it down
+        t = (self.now | MASK) + 1
+        if d.tick < t:
+            t = d.tick
+        if self.wake_tick is None or t < self.wake_tick:
+            self._wake_at(t)
+
+    def remove(self, d):
+        if d.prev is None:
+            self.slots[d.slot] = d.next
+        else:
+            d.prev.next = d.next
+        if d.next is not None:
+            d.next.prev = d.prev
+        d.prev = d.next = None
+        d.slot = -1
+        self.count -= 1
+
+    def _link(self, d):
+        delta = d.tick - self.now
+        tick = d.tick
+        if delta > MAX_TICKS:
+            tick = self.now + MAX_TICKS
+            delta = MAX_TICKS
+        level = 0
+        while delta >> (BITS * (level + 1)):
+            level += 1
+        i = level * SLOTS + ((tick >> (BITS * level)) & MASK)
+        d.slot = i
+        d.prev = None
+        d.next = self.slots[i]
+        if d.next is not None:
+            d.next.prev = d
+        self.slots[i] = d
+
+    def _cascade(self, i):
+        d = self.slots[i]
+        self.slots[i] = None
+        while d is not None:
+            nxt = d.next
+            self._link(d)
+            self.cascaded += 1
+            d = nxt
+
+    def advance(self):
+        # Process the ticks elapsed since the last call
+        n = time.ticks_diff(time.ticks_ms(), self.base) // self.tick_ms
+        if n <= 0:
+            return
+        if not self.count:
+            # Nothing to expire or cascade
+            self.now += n
+            self.base = time.ticks_add(self.base, n * self.tick_ms)
+            return
+        slots = self.slots
+        while n:
+            n -= 1
+            self.now += 1
+            self.base = time.ticks_add(self.base, self.tick_ms)
+            now = self.now
+            if not now & MASK:
+                # Cascade from the highest level which wrapped around
+                level = 1
+                while level < LEVELS - 1 and not (now >> (BITS * level)) & MASK:
+                    level += 1
+                while level:
+                    self._cascade(level * SLOTS + ((now >> (BITS * level)) & MASK))
+                    level -= 1
+            d = slots[now & MASK]
+            slots[now & MASK] = None
+            while d is not None:
+                nxt = d.next
+                d.prev = d.next = None
+                d.slot = -1
+                self.count -= 1
+                self.fire(d)
+                d = nxt
+
+    def fire(self, d):
+        task = d.task
+        d.task = None
+        if task is not None:
+            self.fired += 1
+            core.throw(task, core.TimeoutError())
+
+    def _next(self):
+        # Ticks from now to the next one with work
+        base = self.now & MASK
+        for i in range(1, SLOTS - base):
+            if self.slots[base + i] is not None:
+                return i
+        return SLOTS - base
+
+    def _wake_at(self, tick):
+        self.wake_tick = tick
+        self.gen += 1
+        delay = (tick - self.now) * self.tick_ms - time.ticks_diff(time.ticks_ms(), self.base)
+        core.get_event_loop().call_later_ms(max(delay, 0), self._tick, self.gen)
+
+    def _tick(self, gen):
+        if gen != self.gen:
+            # Replaced by an earlier wake up
+            return
+        self.wake_tick = None
+        self.advance()
+        if self.count:
+            self._wake_at(self.now + self._next())
+
+    def stats(self):
+        return {
+            "armed": self.count,
+            "armed_hwm": self.count_hwm,
+            "fired": self.fired,
+            "cascaded": self.cascaded,
+        }
+
+
+_wheel = None
+
+def get_wheel():
+    global _wheel
+    if _wheel is None:
+        _wheel = TimerWheel()
+    return _wheel
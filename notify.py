@@ -0,0 +1,88 @@
+import time
+
+import uasyncio as asyncio
+
+import buzzer
+
+# Melodies waiting to be played. A melody that is already waiting is not
+# queued again; beyond this many different ones, the oldest is dropped.
+NOTIFY_QUEUE_LEN = 4
+# Shortest time an LED stays on, so that it also shows for quick requests
+LED_HOLD_MS = 150
+
+
+class Notifier:
+    """! @brief Buzzer and LED notifications that don't block the caller.
+    Melodies are queued and played by the run() task, which sleeps on the
+    event loop between the notes. LEDs are switched at once; switching an
+    LED off within `hold_ms` of switching it on is deferred with a timer.
+    """
+
+    def __init__(self, pin=buzzer.pin, size=NOTIFY_QUEUE_LEN, hold_ms=LED_HOLD_MS):
+        self.pin = pin
+        self.size = size
+        self.hold_ms = hold_ms
+        self.queue = []
+        # Task parked in run() waiting for a melody
+        self.task = None
+        # Per LED: ticks_ms when switched on, and a generation number that
+        # invalidates deferred offs when the LED is switched again
+        self.led_on = {}
+        self.led_gen = {}
+        # Counters
+        self.played = 0
+        self.coalesced = 0
+        self.dropped = 0
+
+    def play(self, melody):
+        """! @brief Queue `melody` (e.g. buzzer.NOTIFY1) and return immediately."""
+        if melody in self.queue:
+            self.coalesced += 1
+            return
+        if len(self.queue) == self.size:
+            self.queue.pop(0)
+            self.dropped += 1
+        self.queue.append(melody)
+        t = self.task
+        if t is not None:
+            self.task = None
+            asyncio.get_event_loop().call_soon(t)
+
+    def led(self, led, val):
+        """! @brief Switch `led` on (1) or off (0) without blocking."""
+        gen = self.led_gen.get(led, 0) + 1
+        self.led_gen[led] = gen
+        if val:
+            self.led_on[led] = time.ticks_ms()
+            led.value(1)
+            return
+        on = self.led_on.pop(led, None)
+        if on is not None:
+            left = self.hold_ms - time.ticks_diff(time.ticks_ms(), on)
+            if left > 0:
+                asyncio.get_event_loop().call_later_ms(left, self._led_off, led, gen)
+                return
+        led.value(0)
+
+    def _led_off(self, led, gen):
+        if self.led_gen.get(led) == gen:
+            led.value(0)
+
+    def run(self):
+        """! @brief Coroutine playing the queued melodies one after the other."""
+        while True:
+            while not self.queue:
+                self.task = asyncio.get_event_loop().cur_task
+                # Park the task without rescheduling, play() wakes it up
+                yield False
+            notes, delay_ms, duty = self.queue.pop(0)
+            yield from buzzer.aplay(self.pin.get(), notes, delay_ms, duty)
+            self.played += 1
+
+    def stats(self):
+        return {
+            "queued": len(self.queue),
+            "played": self.played,
+            "coalesced": self.coalesced,
+            "dropped": self.dropped,
+        }
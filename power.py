@@ -0,0 +1,292 @@
+import machine
+import struct
+import time
+
+import uasyncio as asyncio
+
+import sensors
+
+# Battery thresholds in 0.1 % (see SampleRing.batt_pct). Below BATT_LOW the
+# server is up in windows and the node light-sleeps in between; below
+# BATT_CRITICAL it deep-sleeps in between, waking only to take a sample. A
+# mode is left once the battery is HYSTERESIS above its threshold again.
+BATT_LOW = 300
+BATT_CRITICAL = 150
+HYSTERESIS = 50
+# Schedule of the power saving modes: a window of AWAKE_MS with the server
+# up starts every CYCLE_MS. In between, a sample is taken every
+# SAVE_SAMPLE_MS (light sleep) or SLEEP_SAMPLE_MS (deep sleep).
+AWAKE_MS = 120000
+CYCLE_MS = 600000
+SAVE_SAMPLE_MS = 10000
+SLEEP_SAMPLE_MS = 60000
+# Battery check period while awake
+CHECK_MS = 5000
+
+MODE_NORMAL = 0
+MODE_SAVE = 1
+MODE_SLEEP = 2
+MODE_NAMES = ("normal", "save", "sleep")
+# No forced mode, follow the battery
+AUTO = 0xFF
+
+# RTC memory, which survives deep sleep: a header followed by `count`
+# samples taken while sleeping.
+#   magic, version, mode, forced mode, count, time.time() of the next
+#   server window, deep sleep wakes, counters of the reset causes
+MAGIC = b"MMpw"
+VERSION = 1
+HEADER_FMT = "<4sBBBxHII5H"
+HEADER_SIZE = struct.calcsize(HEADER_FMT)
+# time.time(), solar and battery ADC counts, temperature, humidity, flags
+RECORD_FMT = "<IHHhHB"
+RECORD_SIZE = struct.calcsize(RECORD_FMT)
+RTC_BATCH_MAX = 120
+
+# Reset causes counted in the header, as names of machine constants
+CAUSES = ("PWRON_RESET", "HARD_RESET", "WDT_RESET", "DEEPSLEEP_RESET", "SOFT_RESET")
+
+
+class PowerState:
+    """! @brief Power state kept in RTC memory: mode, schedule, reset cause
+    counters and the samples taken while in deep sleep.
+    """
+
+    def __init__(self):
+        self.buf = bytearray(HEADER_SIZE + RTC_BATCH_MAX * RECORD_SIZE)
+        self.mode = MODE_NORMAL
+        self.forced = AUTO
+        self.count = 0
+        self.next_window = 0
+        self.wakes = 0
+        self.causes = [0] * len(CAUSES)
+
+    def load(self, rtc):
+        data = rtc.memory()
+        if len(data) < HEADER_SIZE:
+            return False
+        h = struct.unpack_from(HEADER_FMT, data)
+        if h[0] != MAGIC or h[1] != VERSION:
+            return False
+        self.mode = h[2]
+        self.forced = h[3]
+        self.count = min(h[4], RTC_BATCH_MAX, (len(data) - HEADER_SIZE) // RECORD_SIZE)
+        self.next_window = h[5]
+        self.wakes = h[6]
+        self.causes = list(h[7:])
+        n = HEADER_SIZE + self.count * RECORD_SIZE
+        self.buf[:n] = data[:n]
+        return True
+
+    def save(self, rtc):
+        struct.pack_into(HEADER_FMT, self.buf, 0, MAGIC, VERSION, self.mode, self.forced,
+                         self.count, self.next_window, self.wakes, *self.causes)
+        rtc.memory(self.buf[:HEADER_SIZE + self.count * RECORD_SIZE])
+
+    def add(self, t, solar, batt, temp, hum, flags):
+        """! @brief Store a sample. @return False once the batch is full."""
+        if self.count < RTC_BATCH_MAX:
+            struct.pack_into(RECORD_FMT, self.buf, HEADER_SIZE + self.count * RECORD_SIZE,
+                             t, solar, batt, temp, hum, flags)
+            self.count += 1
+        return self.count < RTC_BATCH_MAX
+
+    def records(self):
+        for i in range(self.count):
+            yield struct.unpack_from(RECORD_FMT, self.buf, HEADER_SIZE + i * RECORD_SIZE)
+
+
+def early_boot(rtc=None):
+    """! @brief First thing at boot: count the reset cause and, on a wake from
+    deep sleep between two server windows, store a sample in RTC memory and
+    go back to sleep without bringing up Wi-Fi or the server.
+    @return the PowerState for PowerManager.
+    """
+    if rtc is None:
+        rtc = machine.RTC()
+    st = PowerState()
+    st.load(rtc)
+    cause = machine.reset_cause()
+    for k in range(len(CAUSES)):
+        if cause == getattr(machine, CAUSES[k], None):
+            st.causes[k] += 1
+    if cause == getattr(machine, "DEEPSLEEP_RESET", None) and st.mode == MODE_SLEEP:
+        st.wakes += 1
+        solar = sensors.AdcFilter(sensors.solarvolt, iir_shift=0)
+        batt = sensors.AdcFilter(sensors.battvolt, iir_shift=0)
+        temp, hum, flags = sensors.measure_dht()
+        room = st.add(time.time(), solar.read(), batt.read(), temp, hum, flags)
+        left = st.next_window - time.time()
+        if room and left > 0:
+            st.save(rtc)
+            machine.deepsleep(min(SLEEP_SAMPLE_MS, left * 1000))
+    st.save(rtc)
+    return st
+
+
+class PowerManager:
+    """! @brief Picks the power mode from the battery level and sleeps on schedule.
+    Runs as a task of the event loop. In the power saving modes the server
+    stays up for AWAKE_MS after boot or a mode change; then the callbacks in
+    `before_sleep` run and the node sleeps until the next window. Create it
+    before the sampler takes its first sample: the samples taken in deep
+    sleep are moved into the ring first, so that it stays in time order.
+    """
+
+    def __init__(self, state, sampler, rtc=None):
+        self.state = state
+        self.sampler = sampler
+        self.rtc = rtc if rtc is not None else machine.RTC()
+        self.normal_period_ms = sampler.period_ms
+        self.window_start = time.ticks_ms()
+        self.before_sleep = []
+        try:
+            self.wake_reason = machine.wake_reason()
+        except AttributeError:
+            self.wake_reason = None
+        # Counters
+        self.drained = 0
+        self.light_sleeps = 0
+        self.light_sleep_ms = 0
+        if state.count:
+            self.drain()
+
+    def battery(self):
+        """! @brief Latest battery charge in 0.1 %, None before the first sample."""
+        ring = self.sampler.ring
+        if not ring.seq:
+            return None
+        return ring.batt_pct[ring.index(ring.seq)]
+
+    def auto_mode(self, pct):
+        mode = self.state.mode
+        if pct < BATT_CRITICAL or (mode == MODE_SLEEP and pct < BATT_CRITICAL + HYSTERESIS):
+            return MODE_SLEEP
+        if pct < BATT_LOW or (mode != MODE_NORMAL and pct < BATT_LOW + HYSTERESIS):
+            return MODE_SAVE
+        return MODE_NORMAL
+
+    def wanted_mode(self):
+        st = self.state
+        if st.forced != AUTO:
+            return st.forced
+        pct = self.battery()
+        if pct is None:
+            return st.mode
+        return self.auto_mode(pct)
+
+    def set_mode(self, mode):
+        st = self.state
+        if mode == st.mode:
+            return
+        print("Power mode:", MODE_NAMES[st.mode], "->", MODE_NAMES[mode])
+        if st.mode == MODE_NORMAL:
+            self.normal_period_ms = self.sampler.period_ms
+        st.mode = mode
+        self.sampler.period_ms = self.normal_period_ms if mode == MODE_NORMAL else SAVE_SAMPLE_MS
+        self.window_start = time.ticks_ms()
+        st.save(self.rtc)
+
+    def force(self, name):
+        """! @brief Force mode `name` of MODE_NAMES, or follow the battery for "auto".
+        @return False if there is no such mode.
+        """
+        if name == "auto":
+            self.state.forced = AUTO
+        elif name in MODE_NAMES:
+            self.state.forced = MODE_NAMES.index(name)
+        else:
+            return False
+        self.set_mode(self.wanted_mode())
+        self.state.save(self.rtc)
+        return True
+
+    def drain(self):
+        """! @brief Move the samples taken in deep sleep into the ring.
+        The log and the rollups pick them up from the ring.
+        """
+        st = self.state
+        for rec in st.records():
+            self.sampler.record(*rec)
+            self.drained += 1
+        st.count = 0
+        st.save(self.rtc)
+
+    def light_sleep(self, ms):
+        """! @brief Coroutine light-sleeping for `ms`, waking up for every sample.
+        Each nap ends when the sampler's next sample is due. The sampler
+        takes it and its subscribers get it before the next nap. Ends early
+        when the battery recovered.
+        """
+        sampler = self.sampler
+        sub = sampler.subscribe(1)
+        end = time.ticks_add(time.ticks_ms(), ms)
+        try:
+            while True:
+                now = time.ticks_ms()
+                left = time.ticks_diff(end, now)
+                if left <= 0 or self.wanted_mode() == MODE_NORMAL:
+                    return
+                step = left
+                if sampler.next_sample is not None:
+                    step = min(left, time.ticks_diff(sampler.next_sample, now))
+                if step > 0:
+                    machine.lightsleep(step)
+                    self.light_sleeps += 1
+                    self.light_sleep_ms += step
+                if step < left:
+                    # Woke up for a sample: wait for it, then let the
+                    # other subscribers (log, rollups) run
+                    yield from sub.wait()
+                    while sub.queue:
+                        sub.queue.popleft()
+                    yield from asyncio.sleep_ms(0)
+        finally:
+            sampler.unsubscribe(sub)
+
+    def window_left_ms(self):
+        if self.state.mode == MODE_NORMAL:
+            return None
+        return max(0, AWAKE_MS - time.ticks_diff(time.ticks_ms(), self.window_start))
+
+    def run(self):
+        while True:
+            self.set_mode(self.wanted_mode())
+            if self.state.mode == MODE_NORMAL or self.window_left_ms():
+                yield from asyncio.sleep_ms(CHECK_MS)
+                continue
+            for cb in self.before_sleep:
+                cb()
+            st = self.state
+            if st.mode == MODE_SLEEP:
+                st.next_window = time.time() + (CYCLE_MS - AWAKE_MS) // 1000
+                st.save(self.rtc)
+                print("Deep sleep, next window at", st.next_window)
+                machine.deepsleep(SLEEP_SAMPLE_MS)
+            yield from self.light_sleep(CYCLE_MS - AWAKE_MS)
+            self.window_start = time.ticks_ms()
+
+    def stats(self):
+        st = self.state
+        causes = {}
+        for k in range(len(CAUSES)):
+            causes[CAUSES[k]] = st.causes[k]
+        pct = self.battery()
+        return {
+            "mode": MODE_NAMES[st.mode],
+            "forced": st.forced != AUTO,
+            "battery": None if pct is None else sensors.decimal(pct, 1),
+            "thresholds": {"low": sensors.decimal(BATT_LOW, 1),
+                           "critical": sensors.decimal(BATT_CRITICAL, 1),
+                           "hysteresis": sensors.decimal(HYSTERESIS, 1)},
+            "schedule": {"awake_ms": AWAKE_MS, "cycle_ms": CYCLE_MS,
+                         "save_sample_ms": SAVE_SAMPLE_MS, "sleep_sample_ms": SLEEP_SAMPLE_MS},
+            "window_left_ms": self.window_left_ms(),
+            "reset_causes": causes,
+            "wake_reason": self.wake_reason,
+            "sleep_wakes": st.wakes,
+            "rtc_samples": st.count,
+            "drained": self.drained,
+            "light_sleeps": self.light_sleeps,
+            "light_sleep_ms": self.light_sleep_ms,
+        }
@@ -0,0 +1,196 @@
+import time
+
+import picoweb
+import sensors
+
+# Rollup tiers as (bucket width in seconds, buckets kept): 1 hour of 10 s,
+# 6 hours of 1 min and 24 hours of 10 min buckets.
+TIERS = ((10, 360), (60, 360), (600, 144))
+# Rolled up columns of the SampleRing as (column, typecode, decimal places
+# of its unit, name in the response). Every bucket keeps min, max and mean.
+FIELDS = (
+    ("solar_mv", "H", 3, "V"),
+    ("solar_ua", "H", 3, "mA"),
+    ("solar_uw", "L", 3, "mW"),
+    ("batt_pct", "H", 1, "battery"),
+    ("temp", "h", 1, "temperature"),
+    ("hum", "H", 1, "humidity"),
+)
+# Buckets returned when the client doesn't give a point budget
+DEFAULT_POINTS = 300
+
+
+class Tier:
+    """! @brief Fixed-size ring of buckets of one width.
+    Samples are folded into the open bucket as they arrive; the bucket is
+    written to the preallocated arrays once a sample of a later bucket comes in.
+    """
+
+    def __init__(self, width, size, typecodes):
+        self.width = width
+        self.size = size
+        self.time = sensors._zeros("L", size)   # bucket start, time.time()
+        self.count = sensors._zeros("H", size)  # samples in the bucket
+        self.min = [sensors._zeros(tc, size) for tc in typecodes]
+        self.max = [sensors._zeros(tc, size) for tc in typecodes]
+        self.mean = [sensors._zeros(tc, size) for tc in typecodes]
+        # Buckets closed so far
+        self.closed = 0
+        # Open bucket
+        self.start = None
+        self.acc_n = 0
+        self.acc_min = [0] * len(typecodes)
+        self.acc_max = [0] * len(typecodes)
+        self.acc_sum = [0] * len(typecodes)
+
+    def add(self, t, values):
+        start = t - t % self.width
+        if start != self.start:
+            if self.acc_n:
+                self.close()
+            self.start = start
+        if self.acc_n:
+            for k in range(len(values)):
+                v = values[k]
+                if v < self.acc_min[k]:
+                    self.acc_min[k] = v
+                elif v > self.acc_max[k]:
+                    self.acc_max[k] = v
+                self.acc_sum[k] += v
+        else:
+            for k in range(len(values)):
+                v = values[k]
+                self.acc_min[k] = self.acc_max[k] = self.acc_sum[k] = v
+        self.acc_n += 1
+
+    def close(self):
+        i = self.closed % self.size
+        n = self.acc_n
+        self.time[i] = self.start
+        self.count[i] = n
+        for k in range(len(self.acc_sum)):
+            self.min[k][i] = self.acc_min[k]
+            self.max[k][i] = self.acc_max[k]
+            self.mean[k][i] = self.acc_sum[k] // n
+        self.closed += 1
+        self.acc_n = 0
+
+    def retained(self):
+        return min(self.closed, self.size)
+
+    def covers(self, t):
+        """! @brief Whether the tier holds everything there is from time `t` on."""
+        if self.closed <= self.size:
+            return True
+        return self.time[self.closed % self.size] <= t
+
+    def positions(self, t_from, t_to):
+        """! @brief Array positions of the closed buckets overlapping `t_from`..`t_to`, oldest first."""
+        t_from -= t_from % self.width
+        n = self.retained()
+        first = self.closed - n
+        lo = 0
+        hi = n
+        while lo < hi:
+            mid = (lo + hi) >> 1
+            if self.time[(first + mid) % self.size] < t_from:
+                lo = mid + 1
+            else:
+                hi = mid
+        for k in range(first + lo, self.closed):
+            i = k % self.size
+            if self.time[i] > t_to:
+                break
+            yield i
+
+
+class Rollups:
+    """! @brief Min/max/mean of the samples of a SampleRing per 10 s, 1 min and 10 min.
+    Maintained incrementally as samples arrive, so a long-range chart is
+    served from at most a few hundred buckets instead of every sample.
+    """
+
+    def __init__(self, ring, tiers=TIERS, fields=FIELDS):
+        self.ring = ring
+        self.fields = fields
+        self.columns = [getattr(ring, f[0]) for f in fields]
+        self.values = [0] * len(fields)
+        typecodes = [f[1] for f in fields]
+        self.tiers = [Tier(width, size, typecodes) for width, size in tiers]
+        # Last sample folded in
+        self.added = ring.seq
+
+    def add(self, seq):
+        ring = self.ring
+        i = ring.index(seq)
+        values = self.values
+        for k in range(len(values)):
+            values[k] = self.columns[k][i]
+        t = ring.time[i]
+        for tier in self.tiers:
+            tier.add(t, values)
+
+    def catch_up(self):
+        """! @brief Fold in the samples recorded since the last call."""
+        ring = self.ring
+        for seq in ring.since(self.added):
+            self.add(seq)
+        self.added = ring.seq
+
+    def run(self, sampler):
+        """! @brief Coroutine folding every new sample into the tiers.
+        The subscription only wakes it up: samples recorded before the task
+        started or faster than it runs are taken from the ring.
+        """
+        sub = sampler.subscribe(1)
+        try:
+            while True:
+                self.catch_up()
+                yield from sub.wait()
+                sub.queue.popleft()
+        finally:
+            sampler.unsubscribe(sub)
+
+    def pick(self, t_from, t_to, points):
+        """! @brief Finest tier holding the range in at most `points` buckets, else the coarsest."""
+        for tier in self.tiers:
+            if (t_to - t_from) // tier.width < points and tier.covers(t_from):
+                return tier
+        return self.tiers[-1]
+
+    def _row(self, t, n, mins, maxs, means, i):
+        parts = ["[%d,%d" % (t, n)]
+        for k in range(len(self.fields)):
+            places = self.fields[k][2]
+            parts.append(",%s,%s,%s" % (sensors.decimal(mins[k][i], places),
+                                        sensors.decimal(maxs[k][i], places),
+                                        sensors.decimal(means[k][i], places)))
+        parts.append("]")
+        return "".join(parts)
+
+    def send(self, writer, t_from, t_to, points=DEFAULT_POINTS):
+        """! @brief Send the buckets of `t_from`..`t_to` as JSON, one row at a time:
+        {"time": now, "width": bucket seconds, "fields": [names],
+         "buckets": [[start, samples, min, max, mean of every field...], ...]}
+        The open bucket comes last, if it is in the range.
+        """
+        tier = self.pick(t_from, t_to, points)
+        yield from picoweb.start_response(writer, "application/json")
+        # Rows are packed into the writer's buffer, not sent one by one
+        yield from writer.awritev(self._rows(tier, t_from, t_to))
+
+    def _rows(self, tier, t_from, t_to):
+        yield '{"time":%d,"width":%d,"fields":[%s],"buckets":[' % (
+            time.time(), tier.width, ",".join('"%s"' % f[3] for f in self.fields))
+        sep = ""
+        for i in tier.positions(t_from, t_to):
+            yield sep + self._row(tier.time[i], tier.count[i], tier.min, tier.max, tier.mean, i)
+            sep = ","
+        if tier.acc_n and t_from - tier.width < tier.start <= t_to:
+            means = [[s // tier.acc_n] for s in tier.acc_sum]
+            yield sep + self._row(tier.start, tier.acc_n, [[v] for v in tier.acc_min],
+                                  [[v] for v in tier.acc_max], means, 0)
+        yield "]}"
+
+    def stats(self):
+        return [{"width": tier.width, "buckets": tier.retained()} for tier in self.tiers]
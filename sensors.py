@@ -0,0 +1,385 @@
+import machine
+import time
+import ucollections
+from array import array
+
+import uasyncio as asyncio
+
+import calib
+import lazy
+
+# Pin numbers allocated for reading Solar Panel, Battery and DHT11
+SOLAR_PIN = 32
+BATT_PIN = 33
+DHT_PIN = 13
+
+
+def _adc(pin):
+    adc = machine.ADC(machine.Pin(pin))
+    # Set Attenuation to Full 3.3V on Pins that read voltage
+    adc.atten(machine.ADC.ATTN_11DB)
+    # Set Resolution to Full range 0 - 4095 on Pins that read voltage
+    adc.width(machine.ADC.WIDTH_12BIT)
+    return adc
+
+
+def _dht():
+    import dht
+    return dht.DHT11(machine.Pin(DHT_PIN))
+
+
+# The peripherals are set up on first use, i.e. by the first sample
+solarvolt = lazy.Lazy("solar ADC", lambda: _adc(SOLAR_PIN))
+battvolt = lazy.Lazy("battery ADC", lambda: _adc(BATT_PIN))
+sensordht = lazy.Lazy("DHT11", _dht)
+
+# Sampling schedule. The DHT11 returns errors when it is measured more often
+# than about once a second, so it gets its own (slower) period and the last
+# good reading is reused in between.
+SAMPLE_PERIOD_MS = 1000
+DHT_PERIOD_MS = 2000
+HISTORY_LEN = 300
+# New samples queued for a push client (e.g. /events) that doesn't keep up.
+# Beyond that the oldest are dropped.
+EVENT_QUEUE_LEN = 8
+
+# ADC oversampling: every sample is reduced from OVERSAMPLE reads with
+# ADC_REDUCE ("median", or "trimmed" for the mean without the ADC_TRIM
+# lowest and highest reads) and then smoothed by an IIR low-pass filter
+# y += (x - y) / 2**ADC_IIR_SHIFT (0 disables it).
+OVERSAMPLE = 8
+ADC_REDUCE = "median"
+ADC_TRIM = 2
+ADC_IIR_SHIFT = 2
+
+# Sample flags
+FLAG_DHT_ERROR = 0x01
+
+
+def _zeros(typecode, size):
+    return array(typecode, (0 for i in range(size)))
+
+
+class AdcFilter:
+    """! @brief Oversampling and filtering stage of one ADC channel.
+    The reads go into a buffer preallocated when the filter is created and
+    are reduced with integer arithmetic only, so a reading doesn't allocate.
+    `adc` is the lazy.Lazy of the machine.ADC to read.
+    """
+
+    def __init__(self, adc, n=OVERSAMPLE, reduce=ADC_REDUCE, trim=ADC_TRIM, iir_shift=ADC_IIR_SHIFT):
+        if reduce not in ("median", "trimmed"):
+            raise ValueError("unknown ADC reduction: %s" % reduce)
+        if reduce == "trimmed" and n <= 2 * trim:
+            raise ValueError("nothing left after trimming")
+        self.adc = adc
+        self.buf = _zeros("H", n)
+        self.median = reduce == "median"
+        self.trim = trim
+        self.iir_shift = iir_shift
+        # Filter state, the output scaled by 2**iir_shift. None until the first read.
+        self.acc = None
+        # Single-shot and filtered value of the last read()
+        self.raw = 0
+        self.value = 0
+
+    def read(self):
+        """! @brief Sample the ADC and return the filtered counts."""
+        buf = self.buf
+        n = len(buf)
+        adc = self.adc.get()
+        # Insertion sort while reading
+        for i in range(n):
+            x = adc.read()
+            j = i
+            while j and buf[j - 1] > x:
+                buf[j] = buf[j - 1]
+                j -= 1
+            buf[j] = x
+            if not i:
+                self.raw = x
+        if self.median:
+            x = buf[n >> 1]
+        else:
+            x = 0
+            for i in range(self.trim, n - self.trim):
+                x += buf[i]
+            x //= n - 2 * self.trim
+        k = self.iir_shift
+        if self.acc is None:
+            self.acc = x << k
+        else:
+            self.acc += x - (self.acc >> k)
+        self.value = self.acc >> k
+        return self.value
+
+
+class SampleRing:
+    """! @brief Fixed-size time series of sensor samples.
+    Every column is an array preallocated when the ring is created, so
+    recording a sample does not allocate. Samples are numbered with a
+    sequence number starting at 1 and the newest `size` of them are kept.
+    """
+
+    def __init__(self, size=HISTORY_LEN):
+        self.size = size
+        self.time = _zeros("L", size)   # time.time() in seconds
+        self.solar = _zeros("H", size)  # solar panel ADC counts, filtered
+        self.batt = _zeros("H", size)   # battery ADC counts, filtered
+        self.solar_raw = _zeros("H", size)  # single-shot ADC counts
+        self.batt_raw = _zeros("H", size)
+        self.temp = _zeros("h", size)   # temperature in 0.1 C
+        self.hum = _zeros("H", size)    # relative humidity in 0.1 %
+        self.flags = _zeros("B", size)
+        # Scaled by calib.Calibration.convert() from the ADC counts
+        self.vout_mv = _zeros("H", size)    # solar divider output in mV
+        self.solar_mv = _zeros("H", size)   # solar panel voltage in mV
+        self.solar_ua = _zeros("H", size)   # solar current in uA
+        self.solar_uw = _zeros("L", size)   # solar power in uW
+        self.batt_pct = _zeros("H", size)   # battery charge in 0.1 %
+        self.seq = 0                    # sequence number of the newest sample
+
+    def append(self, t, solar, batt, temp, hum, flags=0, solar_raw=None, batt_raw=None):
+        i = self.seq % self.size
+        self.time[i] = t
+        self.solar[i] = solar
+        self.batt[i] = batt
+        self.solar_raw[i] = solar if solar_raw is None else solar_raw
+        self.batt_raw[i] = batt if batt_raw is None else batt_raw
+        self.temp[i] = temp
+        self.hum[i] = hum
+        self.flags[i] = flags
+        self.seq += 1
+
+    def index(self, seq):
+        """! @brief Position of sample `seq` in the column arrays."""
+        return (seq - 1) % self.size
+
+    def oldest(self):
+        """! @brief Sequence number of the oldest sample still retained."""
+        return max(1, self.seq - self.size + 1)
+
+    def since(self, seq):
+        """! @brief Sequence numbers of the retained samples newer than `seq`."""
+        return range(max(seq + 1, self.oldest()), self.seq + 1)
+
+
+class Subscription:
+    """! @brief Bounded queue of new sample sequence numbers for one push client.
+    When the client falls behind, the oldest entries are dropped.
+    """
+
+    def __init__(self, size=EVENT_QUEUE_LEN):
+        self.size = size
+        self.queue = ucollections.deque((), size)
+        self.dropped = 0
+        # Task parked in wait(), and the stream it waits on if any
+        self.task = None
+        self.polls = None
+
+    def put(self, seq):
+        if len(self.queue) == self.size:
+            self.dropped += 1
+        self.queue.append(seq)
+        t = self.task
+        if t is None:
+            return
+        self.task = None
+        loop = asyncio.get_event_loop()
+        if self.polls is None:
+            loop.call_soon(t)
+            return
+        # The task waits for input too. If the poller didn't already
+        # schedule it, take it off the poller and schedule it here.
+        prev = t.pend_throw(None)
+        if prev is not None:
+            loop.cancel_io(prev)
+            loop.call_soon(t)
+
+    def wait(self, polls=None):
+        """! @brief Coroutine returning once the queue is not empty.
+        @param polls If given, also return when this stream becomes readable.
+        @return True if woken up because `polls` is readable.
+        """
+        while not self.queue:
+            self.task = asyncio.get_event_loop().cur_task
+            self.polls = polls
+            if polls is None:
+                # Park the task without rescheduling, put() wakes it up
+                yield False
+            else:
+                yield asyncio.IORead(polls)
+                if self.task is not None:
+                    # Woken by the poller, not by put()
+                    self.task = None
+                    return True
+        return False
+
+
+def measure_dht(temp=0, hum=0):
+    """! @brief Measure the DHT11.
+    @return tuple (temperature in 0.1 C, humidity in 0.1 %, flags); the
+            given `temp` and `hum` with FLAG_DHT_ERROR if the measurement failed.
+    """
+    try:
+        sensor = sensordht.get()
+        sensor.measure()
+        return int(sensor.temperature() * 10), int(sensor.humidity() * 10), 0
+    except OSError as e:
+        print('Failed to read sensor.', e)
+        return temp, hum, FLAG_DHT_ERROR
+
+
+class Sampler:
+    """! @brief Periodically reads DHT11, solar and battery ADCs into a SampleRing.
+    HTTP handlers answer from the ring instead of touching the hardware.
+    """
+
+    def __init__(self, ring, period_ms=SAMPLE_PERIOD_MS, dht_period_ms=DHT_PERIOD_MS, cal=None):
+        self.ring = ring
+        # Loaded from flash by the first convert() if not given
+        self.calib = cal
+        # Sequence number of the newest sample with scaled columns
+        self.converted = ring.seq
+        self.period_ms = period_ms
+        self.dht_period_ms = dht_period_ms
+        self.last_dht = None
+        self.temp = 0
+        self.hum = 0
+        self.dht_flags = FLAG_DHT_ERROR
+        self.subscribers = []
+        self.solar_adc = AdcFilter(solarvolt)
+        self.batt_adc = AdcFilter(battvolt)
+        # ticks_ms() the next sample is due at, set by run()
+        self.next_sample = None
+
+    def subscribe(self, size=EVENT_QUEUE_LEN):
+        sub = Subscription(size)
+        self.subscribers.append(sub)
+        return sub
+
+    def unsubscribe(self, sub):
+        self.subscribers.remove(sub)
+
+    def read_dht(self):
+        now = time.ticks_ms()
+        if self.last_dht is not None and time.ticks_diff(now, self.last_dht) < self.dht_period_ms:
+            return
+        self.last_dht = now
+        self.temp, self.hum, self.dht_flags = measure_dht(self.temp, self.hum)
+
+    def set_calibration(self, cal):
+        """! @brief Switch to calibration `cal` and rescale the retained samples."""
+        self.calib = cal
+        self.converted = self.ring.oldest() - 1
+        self.convert()
+
+    def convert(self):
+        """! @brief Scale the samples recorded since the last call, in one batch."""
+        ring = self.ring
+        if self.converted < ring.seq:
+            if self.calib is None:
+                self.calib = calib.Calibration()
+            self.calib.convert(ring, max(self.converted + 1, ring.oldest()), ring.seq)
+            self.converted = ring.seq
+
+    def record(self, t, solar, batt, temp, hum, flags=0, solar_raw=None, batt_raw=None):
+        """! @brief Add a sample to the ring and pass it on to the subscribers."""
+        self.ring.append(t, solar, batt, temp, hum, flags, solar_raw, batt_raw)
+        self.convert()
+        for sub in self.subscribers:
+            sub.put(self.ring.seq)
+
+    def sample(self):
+        self.read_dht()
+        solar = self.solar_adc
+        batt = self.batt_adc
+        self.record(time.time(), solar.read(), batt.read(), self.temp, self.hum,
+                    self.dht_flags, solar.raw, batt.raw)
+
+    def run(self):
+        # Schedule against absolute deadlines so the time spent reading the
+        # sensors doesn't make the sample period drift.
+        deadline = time.ticks_ms()
+        while True:
+            self.sample()
+            deadline = time.ticks_add(deadline, self.period_ms)
+            delay = time.ticks_diff(deadline, time.ticks_ms())
+            if delay < 0:
+                deadline = time.ticks_ms()
+                delay = 0
+            self.next_sample = deadline
+            yield from asyncio.sleep_ms(delay)
+
+
+_DECIMAL_FMT = (None, "%s%d.%01d", "%s%d.%02d", "%s%d.%03d")
+_POW10 = (1, 10, 100, 1000)
+
+
+def decimal(v, places):
+    """! @brief Integer `v` in units of 10**-`places` as a decimal string, e.g. decimal(1234, 3) == "1.234"."""
+    sign = ""
+    if v < 0:
+        sign = "-"
+        v = -v
+    d = _POW10[places]
+    return _DECIMAL_FMT[places] % (sign, v // d, v % d)
+
+
+def get_sensor_readings(ring):
+    """!  @brief Latest Humidity and Temperature reading of the DHT11 sensor.
+
+        @return JSON:
+            -humidity Humidity
+            -tempratureC Temperature in Celsius
+            -tempratureF Temperature in Fahrenheit
+            -Error True if the last measurement of the sensor failed
+    """
+    sensor_readings = {"temperatureC": "-1", "humidity": "-1", "temperatureF": "-1", "Error": True}
+    if not ring.seq:
+        return sensor_readings
+    i = ring.index(ring.seq)
+    temp = ring.temp[i]
+    sensor_readings["temperatureC"] = decimal(temp, 1)
+    sensor_readings["humidity"] = decimal(ring.hum[i], 1)
+    sensor_readings["temperatureF"] = decimal(temp * 9 // 5 + 320, 1)
+    sensor_readings["Error"] = bool(ring.flags[i] & FLAG_DHT_ERROR)
+    return sensor_readings
+
+
+def get_solar_readings(ring):
+    """! @brief Latest voltage reading from solar panels and battery.
+
+        @return JSONString:
+            -voltage_solar Voltage received from Solar Panels
+            -current_solar Current received from Solar Panels
+            -power_solar   Power received from Solar Panels
+            -voltage_batt  Voltage remaining in Battery
+            -solar_adc, battery_adc  Filtered ADC counts the values are computed from
+            -solar_adc_raw, battery_adc_raw  Single-shot ADC counts of the same sample
+    """
+    if not ring.seq:
+        return {}
+    i = ring.index(ring.seq)
+    return {
+        "solar_voltage": decimal(ring.solar_mv[i], 3),
+        "solar_current": decimal(ring.solar_ua[i], 3),
+        "solar_power": decimal(ring.solar_uw[i], 3),
+        "solar_voltage_out": decimal(ring.vout_mv[i], 3),
+        "battery_voltage": decimal(ring.batt_pct[i], 1),
+        "solar_adc": ring.solar[i],
+        "solar_adc_raw": ring.solar_raw[i],
+        "battery_adc": ring.batt[i],
+        "battery_adc_raw": ring.batt_raw[i],
+    }
+
+
+def history_row(ring, seq):
+    """! @brief One sample of the ring as a JSON array:
+    [seq, time, solar V, solar mA, solar mW, battery %, temperature C, humidity %, flags]
+    """
+    i = ring.index(seq)
+    return "[%d,%d,%s,%s,%s,%d,%s,%s,%d]" % (
+        seq, ring.time[i], decimal(ring.solar_mv[i] // 10, 2), decimal(ring.solar_ua[i], 3),
+        decimal(ring.solar_uw[i], 3), (ring.batt_pct[i] + 5) // 10,
+        decimal(ring.temp[i], 1), decimal(ring.hum[i], 1), ring.flags[i])
@@ -0,0 +1,85 @@
+import struct
+import time
+
+import picoweb
+
+# Binary sample record, little endian, 26 bytes:
+#   sequence number          u32
+#   time.time() in seconds   u32
+#   solar ADC counts         u16
+#   battery ADC counts       u16
+#   solar voltage in mV      u16
+#   solar current in uA      u16
+#   solar power in uW        u32
+#   battery percentage       u8
+#   temperature in 0.1 C     i16
+#   humidity in 0.1 %        u16
+#   flags (sensors.FLAG_*)   u8
+RECORD_FMT = "<IIHHHHIBhHB"
+RECORD_SIZE = struct.calcsize(RECORD_FMT)
+
+# Channel byte in front of binary WebSocket messages
+CH_SAMPLE = 1
+CH_IMAGE = 2
+IMAGE_PREFIX = bytes((CH_IMAGE,))
+
+
+def pack_sample(ring, seq, buf, off=0):
+    """! @brief Pack sample `seq` of the ring into `buf` at `off` as one record."""
+    i = ring.index(seq)
+    struct.pack_into(RECORD_FMT, buf, off, seq, ring.time[i], ring.solar[i], ring.batt[i],
+                     ring.solar_mv[i], ring.solar_ua[i], ring.solar_uw[i], ring.batt_pct[i] // 10,
+                     ring.temp[i], ring.hum[i], ring.flags[i])
+
+
+# Binary encoding of the HTTP endpoints, chosen with an Accept header of
+# MIME (or application/octet-stream). A single sample is one record; a
+# batch is a header followed by `count` records:
+#   format version           u8
+#   record size              u8
+#   count                    u16
+#   newest sequence number   u32
+#   time.time() when sent    u32
+MIME = "application/vnd.minimist.telemetry"
+VERSION = 1
+BATCH_FMT = "<BBHII"
+BATCH_HEADER_SIZE = struct.calcsize(BATCH_FMT)
+# Records packed per write of a batch
+BATCH_CHUNK = 16
+
+_MIME = MIME.encode()
+
+
+def wants_binary(req):
+    accept = req.get_header(b"Accept")
+    return accept is not None and (_MIME in accept or b"application/octet-stream" in accept)
+
+
+def send_sample(writer, ring, seq):
+    """! @brief Send sample `seq` as the body of a binary response."""
+    buf = bytearray(RECORD_SIZE)
+    pack_sample(ring, seq, buf)
+    yield from picoweb.start_response(writer, MIME, headers={"Content-Length": str(RECORD_SIZE)})
+    yield from writer.awrite(buf)
+
+
+def send_batch(writer, ring, seqs):
+    """! @brief Send the samples of the range `seqs` as a binary batch response.
+    Records are packed BATCH_CHUNK at a time into one buffer, so the size of
+    the batch doesn't matter for RAM.
+    """
+    n = len(seqs)
+    buf = bytearray(BATCH_CHUNK * RECORD_SIZE)
+    struct.pack_into(BATCH_FMT, buf, 0, VERSION, RECORD_SIZE, n, ring.seq, time.time())
+    yield from picoweb.start_response(writer, MIME, headers={
+        "Content-Length": str(BATCH_HEADER_SIZE + n * RECORD_SIZE)})
+    yield from writer.awrite(buf, 0, BATCH_HEADER_SIZE)
+    off = 0
+    for seq in seqs:
+        pack_sample(ring, seq, buf, off)
+        off += RECORD_SIZE
+        if off == len(buf):
+            yield from writer.awrite(buf, 0, off)
+            off = 0
+    if off:
+        yield from writer.awrite(buf, 0, off)
@@ -0,0 +1,284 @@
+import os
+import struct
+import time
+
+import picoweb
+import telemetry
+
+# Samples are logged to flash as telemetry records, appended to segment
+# files LOG_DIR/seg_<n>.bin of at most SEGMENT_RECORDS records each. Once
+# there are more than MAX_SEGMENTS segments, the oldest is deleted.
+LOG_DIR = "log"
+SEGMENT_RECORDS = 2048
+MAX_SEGMENTS = 8
+# Samples written per flash write. The not yet written ones are read from
+# the SampleRing, which must therefore hold more than this.
+FLUSH_RECORDS = 32
+# Records read from flash per write to the client
+SEND_RECORDS = telemetry.BATCH_CHUNK
+# Most records a /log response holds (the batch count is 16 bit)
+MAX_RECORDS = 0xFFFF
+
+RECORD_SIZE = telemetry.RECORD_SIZE
+# Offset of the time field in a record
+_TIME_OFFSET = 4
+
+
+class Segment:
+    """! @brief Index entry of one segment file: number, record count and time range."""
+
+    def __init__(self, no):
+        self.no = no
+        self.count = 0
+        self.first_time = 0
+        self.last_time = 0
+        # No more appends, e.g. after a torn write or a clock step back
+        self.sealed = False
+
+
+class TelemetryLog:
+    """! @brief Append-only log of the samples of a SampleRing on the filesystem.
+    Samples are not copied anywhere when they are taken: the log task wakes
+    up every FLUSH_RECORDS samples and packs them straight from the ring
+    into one write. The time range of every segment is kept in RAM, so a
+    query only opens the segments it needs and bisects them by seeking.
+    """
+
+    def __init__(self, ring, path=LOG_DIR, segment_records=SEGMENT_RECORDS,
+                 max_segments=MAX_SEGMENTS, flush_records=FLUSH_RECORDS):
+        if flush_records >= ring.size:
+            raise ValueError("flush_records must be smaller than the ring")
+        self.ring = ring
+        self.path = path
+        self.segment_records = segment_records
+        self.max_segments = max_segments
+        self.flush_records = flush_records
+        # Newest sequence number written to flash
+        self.logged = ring.seq
+        self.buf = bytearray(flush_records * RECORD_SIZE)
+        self.tbuf = bytearray(4)
+        self.segments = []
+        # Counters
+        self.writes = 0
+        self.records = 0
+        self.errors = 0
+        self.scan()
+
+    def fname(self, no):
+        return "%s/seg_%d.bin" % (self.path, no)
+
+    def _time_at(self, f, i):
+        f.seek(i * RECORD_SIZE + _TIME_OFFSET)
+        f.readinto(self.tbuf)
+        return struct.unpack_from("<I", self.tbuf)[0]
+
+    def scan(self):
+        """! @brief Build the segment index from the files of the log directory."""
+        try:
+            os.mkdir(self.path)
+        except OSError:
+            pass
+        nos = []
+        for name in os.listdir(self.path):
+            if name.startswith("seg_") and name.endswith(".bin"):
+                try:
+                    nos.append(int(name[4:-4]))
+                except ValueError:
+                    pass
+        nos.sort()
+        self.segments = []
+        for no in nos:
+            fname = self.fname(no)
+            size = os.stat(fname)[6]
+            seg = Segment(no)
+            seg.count = size // RECORD_SIZE
+            if not seg.count:
+                os.remove(fname)
+                continue
+            with open(fname, "rb") as f:
+                seg.first_time = self._time_at(f, 0)
+                seg.last_time = self._time_at(f, seg.count - 1)
+            # A torn record at the end would misalign further appends
+            seg.sealed = size % RECORD_SIZE != 0 or seg.count >= self.segment_records
+            self.segments.append(seg)
+
+    def _segment_for(self, t):
+        # Segment the sample at time `t` is appended to, rotating if needed
+        if self.segments:
+            seg = self.segments[-1]
+            if not seg.sealed and seg.count < self.segment_records and t >= seg.last_time:
+                return seg
+            no = seg.no + 1
+        else:
+            no = 0
+        seg = Segment(no)
+        seg.first_time = t
+        self.segments.append(seg)
+        while len(self.segments) > self.max_segments:
+            old = self.segments.pop(0)
+            try:
+                os.remove(self.fname(old.no))
+            except OSError:
+                pass
+        return seg
+
+    def flush(self):
+        """! @brief Write the samples recorded since the last flush."""
+        ring = self.ring
+        seqs = ring.since(self.logged)
+        buf = self.buf
+        cap = len(buf) // RECORD_SIZE
+        i = 0
+        n = len(seqs)
+        while i < n:
+            t = ring.time[ring.index(seqs[i])]
+            seg = self._segment_for(t)
+            room = min(cap, self.segment_records - seg.count)
+            off = 0
+            last = t
+            while i < n and room:
+                seq = seqs[i]
+                t = ring.time[ring.index(seq)]
+                if t < last:
+                    # Clock stepped back, the segment has to stay sorted
+                    break
+                telemetry.pack_sample(ring, seq, buf, off)
+                off += RECORD_SIZE
+                last = t
+                i += 1
+                room -= 1
+            try:
+                with open(self.fname(seg.no), "ab") as f:
+                    f.write(memoryview(buf)[:off])
+            except OSError as e:
+                # The samples are dropped rather than retried forever
+                print("Log write failed:", e)
+                self.errors += 1
+                seg.sealed = True
+                if not seg.count:
+                    self.segments.remove(seg)
+                continue
+            seg.count += off // RECORD_SIZE
+            seg.last_time = last
+            self.writes += 1
+            self.records += off // RECORD_SIZE
+        self.logged = ring.seq
+
+    def run(self, sampler):
+        """! @brief Coroutine flushing the log every `flush_records` samples."""
+        sub = sampler.subscribe(1)
+        try:
+            while True:
+                yield from sub.wait()
+                sub.queue.popleft()
+                if self.ring.seq - self.logged >= self.flush_records:
+                    self.flush()
+        finally:
+            sampler.unsubscribe(sub)
+
+    def _bisect(self, f, lo, hi, t, after):
+        # First record in lo..hi with time >= t, or > t if `after`
+        while lo < hi:
+            mid = (lo + hi) >> 1
+            tm = self._time_at(f, mid)
+            if tm < t or (after and tm == t):
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def find(self, t_from, t_to):
+        """! @brief Records with a time in `t_from`..`t_to`.
+        @return list of (segment number, first record, end record), total count
+        """
+        spans = []
+        n = 0
+        for seg in self.segments:
+            if not seg.count or seg.last_time < t_from or seg.first_time > t_to:
+                continue
+            a = 0
+            b = seg.count
+            if seg.first_time < t_from or seg.last_time > t_to:
+                with open(self.fname(seg.no), "rb") as f:
+                    if seg.first_time < t_from:
+                        a = self._bisect(f, 0, b, t_from, False)
+                    if seg.last_time > t_to:
+                        b = self._bisect(f, a, b, t_to, True)
+            if b > a:
+                spans.append((seg.no, a, b))
+                n += b - a
+        return spans, n
+
+    def _unflushed(self, logged, t_from, t_to):
+        # Samples in the ring newer than `logged`, within the time range
+        ring = self.ring
+        for seq in ring.since(logged):
+            t = ring.time[ring.index(seq)]
+            if t_from <= t <= t_to:
+                yield seq
+
+    def send(self, writer, t_from, t_to):
+        """! @brief Send the samples with a time in `t_from`..`t_to` as a binary
+        telemetry batch, oldest first. The flash is read SEND_RECORDS records
+        at a time, followed by the samples of the ring not flushed yet.
+        """
+        # The log task may flush while this is sent, the ring part is
+        # taken from where the flash part ends now.
+        logged = self.logged
+        spans, n = self.find(t_from, t_to)
+        tail = 0
+        for seq in self._unflushed(logged, t_from, t_to):
+            tail += 1
+        n = min(n + tail, MAX_RECORDS)
+        buf = bytearray(SEND_RECORDS * RECORD_SIZE)
+        struct.pack_into(telemetry.BATCH_FMT, buf, 0, telemetry.VERSION, RECORD_SIZE,
+                         n, self.ring.seq, time.time())
+        yield from picoweb.start_response(writer, telemetry.MIME, headers={
+            "Content-Length": str(telemetry.BATCH_HEADER_SIZE + n * RECORD_SIZE)})
+        yield from writer.awrite(buf, 0, telemetry.BATCH_HEADER_SIZE)
+        mv = memoryview(buf)
+        for no, a, b in spans:
+            try:
+                f = open(self.fname(no), "rb")
+            except OSError:
+                # Rotated away meanwhile, the response can't be completed
+                writer.keepalive = False
+                return
+            try:
+                f.seek(a * RECORD_SIZE)
+                while a < b and n:
+                    k = min(b - a, SEND_RECORDS, n)
+                    sz = k * RECORD_SIZE
+                    if f.readinto(mv[:sz]) != sz:
+                        writer.keepalive = False
+                        return
+                    yield from writer.awrite(buf, 0, sz)
+                    a += k
+                    n -= k
+            finally:
+                f.close()
+        off = 0
+        for seq in self._unflushed(logged, t_from, t_to):
+            if not n:
+                break
+            telemetry.pack_sample(self.ring, seq, buf, off)
+            off += RECORD_SIZE
+            n -= 1
+            if off == len(buf):
+                yield from writer.awrite(buf, 0, off)
+                off = 0
+        if off:
+            yield from writer.awrite(buf, 0, off)
+        if n:
+            # Samples overwritten in the ring meanwhile, the body is short
+            writer.keepalive = False
+
+    def stats(self):
+        return {
+            "segments": len(self.segments),
+            "records": sum(seg.count for seg in self.segments),
+            "oldest": self.segments[0].first_time if self.segments else 0,
+            "unflushed": self.ring.seq - self.logged,
+            "writes": self.writes,
+            "errors": self.errors,
+        }
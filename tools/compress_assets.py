@@ -0,0 +1,46 @@
+"""Precompress the web assets served by the node (CPython).
+
+Writes <file>.gz next to every file in www/ and static/, which picoweb's
+sendasset() then serves with Content-Encoding: gzip. Run it after every
+change to the assets, before copying the files to the board: sendasset()
+skips a .gz whose gzip trailer doesn't match the CRC-32 and size of its
+source, and serves the uncompressed file instead. E.g.:
+
+    python3 tools/compress_assets.py
+    mpremote fs cp -r www static :
+
+The output is deterministic (no timestamp in the gzip header), so the ETags
+computed on the node only change when the content does.
+"""
+import gzip
+import os
+import sys
+
+ASSET_DIRS = ("www", "static")
+
+
+def compress(path):
+    with open(path, "rb") as f:
+        data = f.read()
+    gz = gzip.compress(data, compresslevel=9, mtime=0)
+    with open(path + ".gz", "wb") as f:
+        f.write(gz)
+    print("%-40s %8d -> %8d bytes" % (path, len(data), len(gz)))
+
+
+def main():
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    if len(sys.argv) > 1:
+        root = sys.argv[1]
+    for d in ASSET_DIRS:
+        d = os.path.join(root, d)
+        if not os.path.isdir(d):
+            continue
+        for name in sorted(os.listdir(d)):
+            path = os.path.join(d, name)
+            if os.path.isfile(path) and not name.endswith(".gz"):
+                compress(path)
+
+
+if __name__ == "__main__":
+    main()
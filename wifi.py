@@ -0,0 +1,167 @@
+import time
+import network
+
+import uasyncio as asyncio
+
+import config
+
+# A scan (which blocks for a couple of seconds) is reused for this long
+SCAN_MAX_AGE_MS = 60000
+# Time given to one network to associate and get an address
+CONNECT_TIMEOUT_MS = 10000
+CONNECT_POLL_MS = 250
+# Link check period while connected
+CHECK_MS = 2000
+# Pause after every network failed, doubling up to the maximum
+BACKOFF_MIN_MS = 1000
+BACKOFF_MAX_MS = 60000
+
+STATE_DOWN = "down"
+STATE_CONNECTING = "connecting"
+STATE_UP = "up"
+
+
+class WifiSupervisor:
+    """! @brief Keeps the station connected to one of the known networks.
+    run() is a task of the event loop: the web-server starts right away and
+    the node reconnects on its own when the link drops, instead of waiting
+    for (or giving up on) Wi-Fi at boot.
+    """
+
+    def __init__(self, networks=config.NETWORKS, hostname=config.HOST_NAME):
+        self.networks = networks
+        self.hostname = hostname
+        self.sta = network.WLAN(network.STA_IF)
+        self.state = STATE_DOWN
+        self.ssid = None
+        self.ip = None
+        # Cached scan: (ssid, rssi) of the known networks in range, strongest first
+        self.seen = []
+        self.scan_time = None
+        # Called without arguments when the link comes up / a round of
+        # connection attempts failed
+        self.on_up = None
+        self.on_fail = None
+        # Counters
+        self.connects = 0
+        self.failures = 0
+        self.drops = 0
+        self.scans = 0
+        self.up_since = None
+        self.connect_ms = 0
+
+    def scan(self):
+        """! @brief Known networks in range, strongest first, from a cached scan."""
+        now = time.ticks_ms()
+        if self.scan_time is not None and time.ticks_diff(now, self.scan_time) < SCAN_MAX_AGE_MS:
+            return self.seen
+        seen = []
+        try:
+            for ssid, bssid, channel, rssi, authmode, hidden in self.sta.scan():
+                ssid = ssid.decode()
+                if ssid in self.networks:
+                    seen.append((ssid, rssi))
+        except OSError as e:
+            print("Wi-Fi scan failed:", e)
+        seen.sort(key=lambda n: n[1], reverse=True)
+        self.seen = seen
+        self.scan_time = now
+        self.scans += 1
+        return seen
+
+    def candidates(self):
+        seen = self.scan()
+        if not seen:
+            # Nothing known in range, or hidden: try them all
+            return list(self.networks)
+        return [ssid for ssid, rssi in seen]
+
+    def connect(self, ssid):
+        """! @brief Coroutine trying `ssid`, returns True once connected."""
+        print("[*] Connecting to WIFI", ssid)
+        start = time.ticks_ms()
+        try:
+            self.sta.connect(ssid, self.networks[ssid])
+        except OSError as e:
+            print("Wi-Fi connect failed:", e)
+            return False
+        while not self.sta.isconnected():
+            if time.ticks_diff(time.ticks_ms(), start) > CONNECT_TIMEOUT_MS:
+                self.sta.disconnect()
+                return False
+            yield from asyncio.sleep_ms(CONNECT_POLL_MS)
+        self.ssid = ssid
+        self.connect_ms = time.ticks_diff(time.ticks_ms(), start)
+        return True
+
+    def _up(self):
+        self.state = STATE_UP
+        self.connects += 1
+        self.up_since = time.ticks_ms()
+        ifconfig = self.sta.ifconfig()
+        self.ip = ifconfig[0]
+        print("\n[*] Network information for SSID: ", self.ssid,
+              "\n  [+] ESP32 IP Addr: ", ifconfig[0],
+              "\n  [+] ESP32 Hostname : ", self.hostname,
+              "\n  [+] Subnet Mask : ", ifconfig[1],
+              "\n  [+] Gateway IP : ", ifconfig[2],
+              "\n  [+] DNS : ", ifconfig[3])
+        if self.on_up is not None:
+            self.on_up()
+
+    def run(self):
+        """! @brief Coroutine connecting, watching the link and reconnecting with backoff."""
+        self.sta.active(True)
+        try:
+            self.sta.config(dhcp_hostname=self.hostname)
+        except (OSError, ValueError):
+            pass
+        backoff = BACKOFF_MIN_MS
+        while True:
+            if self.sta.isconnected():
+                if self.state != STATE_UP:
+                    self._up()
+                yield from asyncio.sleep_ms(CHECK_MS)
+                continue
+            if self.state == STATE_UP:
+                print("Wi-Fi link lost")
+                self.drops += 1
+                self.ip = None
+                self.up_since = None
+            self.state = STATE_CONNECTING
+            for ssid in self.candidates():
+                if (yield from self.connect(ssid)):
+                    backoff = BACKOFF_MIN_MS
+                    break
+            else:
+                print("Cound't connect to a known Wifi network, retry in %d ms" % backoff)
+                self.state = STATE_DOWN
+                self.failures += 1
+                # The networks around may have changed
+                self.scan_time = None
+                if self.on_fail is not None:
+                    self.on_fail()
+                yield from asyncio.sleep_ms(backoff)
+                backoff = min(backoff * 2, BACKOFF_MAX_MS)
+
+    def rssi(self):
+        if self.state != STATE_UP:
+            return None
+        try:
+            return self.sta.status("rssi")
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def stats(self):
+        return {
+            "state": self.state,
+            "ssid": self.ssid,
+            "ip": self.ip,
+            "rssi": self.rssi(),
+            "uptime_s": time.ticks_diff(time.ticks_ms(), self.up_since) // 1000 if self.up_since is not None else 0,
+            "connects": self.connects,
+            "failures": self.failures,
+            "drops": self.drops,
+            "scans": self.scans,
+            "connect_ms": self.connect_ms,
+        }